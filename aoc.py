@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import importlib.util
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Generator, Iterable, Optional, Union
+
+import fire
+
+ROOT = Path(__file__).resolve().parent
+
+# Solvers that plot must never block a batch run on a GUI window.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+HEAVY_MODULES = ("joblib", "matplotlib", "networkx", "pandas", "scipy", "tqdm")
+
+IMPORT_PROFILE_SCRIPT = """
+import importlib.util, json, sys, time
+
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("solver", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules["solver"] = module
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"import_s": elapsed, "modules": sorted({name.split(".")[0] for name in sys.modules})}))
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Solver:
+    day: int
+    part: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"day_{self.day:02d}/part_{self.part}"
+
+    @property
+    def module_name(self) -> str:
+        return f"day_{self.day:02d}_part_{self.part}"
+
+    def load(self) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(self.module_name, self.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[self.module_name] = module
+        spec.loader.exec_module(module)
+        return module
+
+
+@dataclasses.dataclass
+class ImportProfile:
+    name: str
+    import_s: float
+    heavy_modules: list[str]
+
+
+@dataclasses.dataclass
+class Timing:
+    name: str
+    import_s: float
+    cold_s: float
+    warm_s: Optional[float]
+    peak_rss_mb: float
+    result: str
+    error: Optional[str] = None
+
+
+def discover(days: Optional[Iterable[int]] = None, root: Path = ROOT) -> list[Solver]:
+    days = None if days is None else set(days)
+    solvers = []
+    for path in sorted(root.glob("day_*/part_*/main.py")):
+        day = int(path.parent.parent.name.removeprefix("day_"))
+        part = int(path.parent.name.removeprefix("part_"))
+        if days is None or day in days:
+            solvers.append(Solver(day=day, part=part, path=path))
+    return solvers
+
+
+@contextlib.contextmanager
+def working_directory(path: Path) -> Generator[None, None, None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def import_profile(solver: Solver) -> ImportProfile:
+    # A fresh interpreter, since modules imported by earlier solvers would hide the real cost.
+    process = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROFILE_SCRIPT, str(solver.path)],
+        cwd=solver.path.parent,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    profile = json.loads(process.stdout.splitlines()[-1])
+    return ImportProfile(
+        name=solver.name,
+        import_s=profile["import_s"],
+        heavy_modules=[module for module in HEAVY_MODULES if module in profile["modules"]],
+    )
+
+
+def timed_call(function: Callable[[], None]) -> tuple[float, str]:
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+    lines = stdout.getvalue().strip().splitlines()
+    return elapsed, lines[-1] if lines else ""
+
+
+def run_solver(solver: Solver, repeat: int = 1) -> Timing:
+    import_s, cold_s, warm_s, result, error = 0.0, 0.0, None, "", None
+    try:
+        with working_directory(solver.path.parent):
+            start = time.perf_counter()
+            module = solver.load()
+            import_s = time.perf_counter() - start
+
+            cold_s, result = timed_call(module.main)
+            cold_s += import_s
+            if repeat > 0:
+                warm_s = min(timed_call(module.main)[0] for _ in range(repeat))
+    except Exception as e:
+        error = repr(e)
+
+    return Timing(
+        name=solver.name,
+        import_s=import_s,
+        cold_s=cold_s,
+        warm_s=warm_s,
+        peak_rss_mb=peak_rss_mb(),
+        result=result,
+        error=error,
+    )
+
+
+def format_table(timings: list[Timing]) -> str:
+    rows = [("solver", "import [s]", "cold [s]", "warm [s]", "peak rss [MB]", "result")]
+    for timing in timings:
+        rows.append(
+            (
+                timing.name,
+                f"{timing.import_s:.4f}",
+                f"{timing.cold_s:.4f}",
+                "-" if timing.warm_s is None else f"{timing.warm_s:.4f}",
+                f"{timing.peak_rss_mb:.1f}",
+                timing.result if timing.error is None else f"ERROR {timing.error}",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1] for row in rows)
+
+
+def main(days: Union[int, Iterable[int], None] = None, repeat: int = 1, output: str = "table") -> None:
+    if isinstance(days, int):
+        days = [days]
+
+    timings = [run_solver(solver, repeat=repeat) for solver in discover(days)]
+
+    if output == "json":
+        print(json.dumps([dataclasses.asdict(timing) for timing in timings], indent=2))
+    elif output == "table":
+        print(format_table(timings))
+    else:
+        raise ValueError(f"Unexpected output format {output}")
+
+
+if __name__ == "__main__":
+    fire.Fire(main)
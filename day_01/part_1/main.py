@@ -1,11 +1,35 @@
+from typing import Generator, Iterable
+
 import fire
+import numpy as np
+
+
+def read_chunks(input_file: str, chunk_size: int = 2**20) -> Generator[np.ndarray, None, None]:
+    with open(input_file, "rb") as f:
+        remainder = b""
+        while chunk := f.read(chunk_size):
+            chunk = remainder + chunk
+            cut = chunk.rfind(b"\n") + 1
+            chunk, remainder = chunk[:cut], chunk[cut:]
+            if chunk.strip():
+                yield np.fromstring(chunk, dtype=np.int64, sep="\n")
+        if remainder.strip():
+            yield np.fromstring(remainder, dtype=np.int64, sep="\n")
+
 
+def count_increases(chunks: Iterable[np.ndarray], window: int = 1) -> int:
+    # Two sliding window sums only differ in the values entering and leaving, so comparing those is enough.
+    count = 0
+    tail = np.empty(0, dtype=np.int64)
+    for chunk in chunks:
+        values = np.concatenate((tail, chunk))
+        count += int(np.sum(values[window:] > values[:-window]))
+        tail = values[-window:]
+    return count
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        data = [int(x) for x in f.read().splitlines()]
 
-    count = sum(cur > prev for prev, cur in zip(data[:-1], data[1:]))
+def main(input_file: str = "input.txt", chunk_size: int = 2**20) -> None:
+    count = count_increases(read_chunks(input_file, chunk_size), window=1)
 
     print(count)
 
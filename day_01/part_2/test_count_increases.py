@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from main import count_increases, read_chunks
+
+EXAMPLE = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+
+@pytest.mark.parametrize("window, expected", [(1, 7), (3, 5)])
+def test_count_increases(window, expected):
+    assert count_increases([np.array(EXAMPLE)], window=window) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 1000])
+@pytest.mark.parametrize("window", [1, 3])
+def test_read_chunks(tmp_path, chunk_size, window):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("\n".join(map(str, EXAMPLE)))
+
+    chunks = list(read_chunks(str(input_file), chunk_size))
+
+    assert np.concatenate(chunks).tolist() == EXAMPLE
+    assert count_increases(chunks, window=window) == count_increases([np.array(EXAMPLE)], window=window)
@@ -1,26 +1,89 @@
+from typing import Generator
+
 import fire
+import numpy as np
+
+COMMAND_DIRECTIONS = {b"forward": (0, 1), b"down": (1, 0), b"up": (-1, 0)}
+
+
+def build_direction_table() -> np.ndarray:
+    # The first byte selects the command, encode then checks that the whole word matches it.
+    table = np.zeros((256, 2), dtype=np.int64)
+    for command, direction in COMMAND_DIRECTIONS.items():
+        table[command[0]] = direction
+    return table
+
+
+DIRECTION_TABLE = build_direction_table()
+
+
+def encode(chunk: bytes) -> tuple[np.ndarray, np.ndarray]:
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    lowered = data | 0x20
+    is_letter = (lowered >= ord("a")) & (lowered <= ord("z"))
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], is_letter, [False])).astype(np.int8)))
+    starts, stops = edges[0::2], edges[1::2]
+    command_bytes = data[starts]
+
+    known = np.zeros(len(starts), dtype=bool)
+    for command in COMMAND_DIRECTIONS:
+        candidates = np.flatnonzero((command_bytes == command[0]) & (stops - starts == len(command)))
+        letters = data[starts[candidates, np.newaxis] + np.arange(len(command))]
+        known[candidates[np.all(letters == np.frombuffer(command, dtype=np.uint8), axis=1)]] = True
+    if not np.all(known):
+        unexpected = int(np.argmin(known))
+        raise ValueError(f"Unexpected command {chunk[starts[unexpected] : stops[unexpected]].decode()}")
+
+    digits = data.copy()
+    digits[is_letter] = ord(" ")
+    values = np.fromstring(digits.tobytes(), dtype=np.int64, sep=" ")
+    if len(values) != len(command_bytes):
+        raise ValueError(f"Unexpected {len(values)} values for {len(command_bytes)} commands")
+
+    down, forward = (DIRECTION_TABLE[command_bytes] * values[:, np.newaxis]).T
+    return down, forward
+
+
+def read_commands(input_file: str, chunk_size: int = 2**20) -> Generator[tuple[np.ndarray, np.ndarray], None, None]:
+    with open(input_file, "rb") as f:
+        remainder = b""
+        while chunk := f.read(chunk_size):
+            chunk = remainder + chunk
+            cut = chunk.rfind(b"\n") + 1
+            chunk, remainder = chunk[:cut], chunk[cut:]
+            if chunk.strip():
+                yield encode(chunk)
+        if remainder.strip():
+            yield encode(remainder)
+
+
+def trajectory(down: np.ndarray, forward: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    aims = np.cumsum(down)
+    if len(aims) and int(np.abs(aims).max()) * int(np.abs(forward).sum()) >= 2**63:
+        raise OverflowError("Depths of the chunk do not fit into 64 bits, use a smaller chunk_size")
+    return np.cumsum(forward), np.cumsum(aims * forward), aims
+
 
+def advance(position: tuple[int, int, int], down: np.ndarray, forward: np.ndarray) -> tuple[int, int, int]:
+    # The chunk is integrated from zero in int64, the position carried between chunks stays exact in Python ints.
+    if not len(down):
+        return position
+    horizontal_pos, depth, aim = position
+    horizontal_positions, depths, aims = trajectory(down, forward)
+    return (
+        horizontal_pos + int(horizontal_positions[-1]),
+        depth + aim * int(horizontal_positions[-1]) + int(depths[-1]),
+        aim + int(aims[-1]),
+    )
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        data = [x.split() for x in f.read().splitlines()]
 
-    horizontal_pos = 0
-    depth = 0
-    aim = 0
+def main(input_file: str = "input.txt", chunk_size: int = 2**20) -> None:
+    position = (0, 0, 0)
 
-    for command, value in data:
-        value = int(value)
-        if command == "up":
-            aim -= value
-        elif command == "down":
-            aim += value
-        elif command == "forward":
-            horizontal_pos += value
-            depth += aim * value
-        else:
-            raise ValueError(f"Unexpected command {command}")
+    for down, forward in read_commands(input_file, chunk_size):
+        position = advance(position, down, forward)
 
+    horizontal_pos, depth, _ = position
     print(horizontal_pos * depth)
 
 
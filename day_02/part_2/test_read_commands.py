@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from main import advance, encode, read_commands, trajectory
+
+EXAMPLE = """forward 5
+down 5
+forward 8
+up 3
+down 8
+forward 2
+"""
+
+
+def test_encode():
+    down, forward = encode(EXAMPLE.encode())
+
+    np.testing.assert_equal(down, [0, 5, 0, -3, 8, 0])
+    np.testing.assert_equal(forward, [5, 0, 8, 0, 0, 2])
+
+
+@pytest.mark.parametrize(
+    "chunk, command",
+    [
+        (b"forward 1\nbackward 2\n", "backward"),
+        (b"fast 5\ndownward 5\nforward 8\n", "fast"),
+        (b"forward 5\ndownward 5\n", "downward"),
+        (b"forward 5\nuq 5\n", "uq"),
+        (b"forward 5\nForward 5\n", "Forward"),
+        (b"forward\nfast 5\n", "fast"),
+    ],
+)
+def test_encode_unexpected_command(chunk, command):
+    with pytest.raises(ValueError, match=f"Unexpected command {command}$"):
+        encode(chunk)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 10, 1000])
+def test_read_commands(tmp_path, chunk_size):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(EXAMPLE)
+
+    down, forward = map(np.concatenate, zip(*read_commands(str(input_file), chunk_size)))
+
+    np.testing.assert_equal(down, [0, 5, 0, -3, 8, 0])
+    np.testing.assert_equal(forward, [5, 0, 8, 0, 0, 2])
+
+
+def test_trajectory():
+    horizontal_positions, depths, aims = trajectory(*encode(EXAMPLE.encode()))
+
+    np.testing.assert_equal(horizontal_positions, [5, 5, 13, 13, 13, 15])
+    np.testing.assert_equal(depths, [0, 0, 40, 40, 40, 60])
+    np.testing.assert_equal(aims, [0, 5, 5, 2, 10, 10])
+
+    first, second = encode(b"forward 5\ndown 5\nforward 8\n"), encode(b"up 3\ndown 8\nforward 2\n")
+    assert advance(advance((0, 0, 0), *first), *second) == (15, 60, 10)
+
+
+def test_advance_beyond_64_bits():
+    down, forward = encode(b"down 5\nforward 8\n")
+
+    assert advance((2**70, 2**70, 2**70), down, forward) == (
+        2**70 + 8,
+        2**70 + (2**70 + 5) * 8,
+        2**70 + 5,
+    )
+
+
+def test_trajectory_overflow():
+    with pytest.raises(OverflowError):
+        trajectory(np.array([2**40, 0]), np.array([0, 2**40]))
+
+
+def test_encode_missing_value():
+    with pytest.raises(ValueError, match="values"):
+        encode(b"forward\ndown 2\n")
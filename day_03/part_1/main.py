@@ -1,19 +1,30 @@
-import functools
-import operator
-
 import fire
 import numpy as np
 
 
+def parse_input(input_file: str) -> np.ndarray:
+    with open(input_file, "rb") as f:
+        first_line = f.readline()
+        raw = first_line + f.read()
+    width = len(first_line.rstrip(b"\r\n"))
+    terminator = first_line[width:]
+    raw = raw.rstrip(b"\r\n") + terminator
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, width + len(terminator))[:, :width] - ord("0")
+
+
+def pack(bits: np.ndarray) -> np.ndarray:
+    weights = np.uint64(1) << np.arange(bits.shape[-1] - 1, -1, -1, dtype=np.uint64)
+    return np.sum(bits.astype(np.uint64) * weights, axis=-1, dtype=np.uint64)
+
+
 def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        data = np.array([list(x) for x in f.read().splitlines()]).astype(int)
+    data = parse_input(input_file)
 
     sums = np.sum(data, axis=0)
 
     counts = sums > len(data) / 2
-    gamma = int(functools.reduce(operator.add, counts.astype(int).astype(str)), 2)
-    epsilon = int(functools.reduce(operator.add, (~counts).astype(int).astype(str)), 2)
+    gamma = int(pack(counts))
+    epsilon = int(pack(~counts))
 
     print(gamma * epsilon)
 
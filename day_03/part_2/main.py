@@ -1,43 +1,48 @@
-import functools
-import operator
-
 import fire
 import numpy as np
 
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        source_data = np.array([list(x) for x in f.read().splitlines()]).astype(int)
+def parse_input(input_file: str) -> np.ndarray:
+    with open(input_file, "rb") as f:
+        first_line = f.readline()
+        raw = first_line + f.read()
+    width = len(first_line.rstrip(b"\r\n"))
+    terminator = first_line[width:]
+    raw = raw.rstrip(b"\r\n") + terminator
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, width + len(terminator))[:, :width] - ord("0")
 
-    data = source_data.copy()
-    for col_index in range(data.shape[1]):
-        one_count = np.sum(data[:, col_index])
-        zero_count = len(data) - one_count
 
-        value = int(one_count >= zero_count)
+def pack(bits: np.ndarray) -> np.ndarray:
+    weights = np.uint64(1) << np.arange(bits.shape[-1] - 1, -1, -1, dtype=np.uint64)
+    return np.sum(bits.astype(np.uint64) * weights, axis=-1, dtype=np.uint64)
 
-        data = data[data[:, col_index] == value, :]
 
-        if len(data) == 1:
+def find_rating(values: np.ndarray, width: int, keep_most_common: bool) -> int:
+    # values is sorted, so the rows matching the prefix chosen so far form the range low:high and within that range the
+    # rows with the next bit cleared come before those with it set.
+    low, high = 0, len(values)
+    for bit in range(width - 1, -1, -1):
+        if high - low == 1:
             break
 
-    data = np.squeeze(data)
-    oxygen_rating = int(functools.reduce(operator.add, data.astype(int).astype(str)), 2)
+        threshold = int(values[low]) >> (bit + 1) << (bit + 1) | 1 << bit
+        split = low + int(np.searchsorted(values[low:high], np.uint64(threshold)))
+        zero_count, one_count = split - low, high - split
 
-    data = source_data.copy()
-    for col_index in range(data.shape[1]):
-        one_count = np.sum(data[:, col_index])
-        zero_count = len(data) - one_count
+        keep_ones = one_count >= zero_count if keep_most_common else zero_count > one_count
+        if one_count == 0 or zero_count == 0:
+            keep_ones = one_count > 0
+        low, high = (split, high) if keep_ones else (low, split)
 
-        value = int(zero_count > one_count)
+    return int(values[low])
 
-        data = data[data[:, col_index] == value, :]
 
-        if len(data) == 1:
-            break
+def main(input_file: str = "input.txt") -> None:
+    data = parse_input(input_file)
+    values = np.sort(pack(data))
 
-    data = np.squeeze(data)
-    co2_rating = int(functools.reduce(operator.add, data.astype(int).astype(str)), 2)
+    oxygen_rating = find_rating(values, data.shape[1], keep_most_common=True)
+    co2_rating = find_rating(values, data.shape[1], keep_most_common=False)
 
     print(oxygen_rating * co2_rating)
 
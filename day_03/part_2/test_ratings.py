@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from main import find_rating, pack, parse_input
+
+EXAMPLE = np.array(
+    [
+        list(map(int, row))
+        for row in [
+            "00100",
+            "11110",
+            "10110",
+            "10111",
+            "10101",
+            "01111",
+            "00111",
+            "11100",
+            "10000",
+            "11001",
+            "00010",
+            "01010",
+        ]
+    ]
+)
+
+
+def filter_rating(data: np.ndarray, keep_most_common: bool) -> int:
+    for col_index in range(data.shape[1]):
+        one_count = np.sum(data[:, col_index])
+        zero_count = len(data) - one_count
+        value = int(one_count >= zero_count) if keep_most_common else int(zero_count > one_count)
+        if one_count == 0 or zero_count == 0:
+            value = int(one_count > 0)
+        data = data[data[:, col_index] == value, :]
+        if len(data) == 1:
+            break
+    return int(pack(data[0]))
+
+
+def test_pack():
+    assert list(pack(EXAMPLE[:3])) == [4, 30, 22]
+    assert int(pack(np.ones(64, dtype=int))) == 2**64 - 1
+
+
+@pytest.mark.parametrize("keep_most_common, expected", [(True, 23), (False, 10)])
+def test_find_rating(keep_most_common, expected):
+    assert find_rating(np.sort(pack(EXAMPLE)), EXAMPLE.shape[1], keep_most_common) == expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("keep_most_common", [True, False])
+def test_find_rating_matches_filter(seed, keep_most_common):
+    data = np.unique(np.random.default_rng(seed).integers(0, 2, size=(200, 12)), axis=0)
+
+    assert find_rating(np.sort(pack(data)), data.shape[1], keep_most_common) == filter_rating(data, keep_most_common)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_parse_input(tmp_path, newline, trailing_newline):
+    input_file = tmp_path / "input.txt"
+    rows = ["".join(map(str, row)) for row in EXAMPLE]
+    input_file.write_bytes((newline.join(rows) + (newline if trailing_newline else "")).encode())
+
+    np.testing.assert_equal(parse_input(str(input_file)), EXAMPLE)
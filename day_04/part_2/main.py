@@ -1,50 +1,77 @@
 import dataclasses
+from typing import Generator, Iterable
 
 import fire
 import numpy as np
 
 
 @dataclasses.dataclass
-class Board:
-    values: np.ndarray
-    crossed_out: np.ndarray = dataclasses.field(default_factory=lambda: np.zeros(shape=(5, 5), dtype=bool))
+class Win:
+    board: int
+    draw: int
+    score: int
 
-    def has_won(self) -> bool:
-        for i in range(5):
-            if all(self.crossed_out[i, :]) or all(self.crossed_out[:, i]):
-                return True
-        return False
 
-    def hit(self, value: int) -> None:
-        for i in range(5):
-            for j in range(5):
-                if self.values[i, j] == value:
-                    self.crossed_out[i, j] = True
+@dataclasses.dataclass
+class Bingo:
+    boards: np.ndarray
 
-    def score(self) -> int:
-        return int(np.sum(self.values[~self.crossed_out], axis=None))
+    def play(self, draws: Iterable[int]) -> Generator[Win, None, None]:
+        count, size, _ = self.boards.shape
+        values = self.boards.reshape(count * size * size)
 
+        # Cells sorted by value, so the cells holding a draw are one searchsorted range.
+        cells_by_value = np.argsort(values, kind="stable")
+        sorted_values = values[cells_by_value]
 
-def main(input_file: str = "input.txt") -> None:
+        marked = np.zeros(count * size * size, dtype=bool)
+        row_hits = np.zeros((count, size), dtype=int)
+        col_hits = np.zeros((count, size), dtype=int)
+        unmarked_sums = self.boards.reshape(count, size * size).sum(axis=1)
+        has_won = np.zeros(count, dtype=bool)
+        remaining = count
+
+        for draw in draws:
+            low, high = np.searchsorted(sorted_values, draw, side="left"), np.searchsorted(
+                sorted_values, draw, side="right"
+            )
+            cells = cells_by_value[low:high]
+            cells = cells[~marked[cells]]
+            marked[cells] = True
+
+            boards, rows, cols = cells // (size * size), cells // size % size, cells % size
+            np.add.at(row_hits, (boards, rows), 1)
+            np.add.at(col_hits, (boards, cols), 1)
+            np.subtract.at(unmarked_sums, boards, draw)
+
+            completed = (row_hits[boards, rows] == size) | (col_hits[boards, cols] == size)
+            for board in np.unique(boards[completed & ~has_won[boards]]):
+                has_won[board] = True
+                remaining -= 1
+                yield Win(board=int(board), draw=draw, score=int(unmarked_sums[board]) * draw)
+
+            if remaining == 0:
+                return
+
+
+def parse_input(input_file: str) -> tuple[list[int], np.ndarray]:
     with open(input_file) as f:
         draws = list(map(int, f.readline().split(",")))
-        lines = [np.array(line.split()).astype(int) for line in f.readlines() if line.strip()]
-
-        boards = []
-
-        while lines:
-            current, lines = lines[:5], lines[5:]
-            boards.append(Board(values=np.array(current)))
-
-    winners = set()
-    for draw in draws:
-        for idx, board in enumerate(boards):
-            board.hit(draw)
-            if board.has_won():
-                winners.add(idx)
-                if len(winners) >= len(boards):
-                    print(board.score() * draw)
-                    return
+        rows = [line.split() for line in f.read().splitlines() if line.strip()]
+
+    size = len(rows[0])
+    boards = np.array(rows, dtype=int).reshape(-1, size, size)
+    return draws, boards
+
+
+def main(input_file: str = "input.txt") -> None:
+    draws, boards = parse_input(input_file)
+
+    wins = list(Bingo(boards).play(draws))
+    if not wins:
+        raise ValueError("Unexpected draws, no board ever wins")
+    win = wins[-1]
+    print(win.score)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from main import Bingo, Win, main
+
+DRAWS = [7, 4, 9, 5, 11, 17, 23, 2, 0, 14, 21, 24, 10, 16, 13, 6, 15, 25, 12, 22, 18, 20, 8, 19, 3, 26, 1]
+BOARDS = np.array(
+    [
+        [
+            [22, 13, 17, 11, 0],
+            [8, 2, 23, 4, 24],
+            [21, 9, 14, 16, 7],
+            [6, 10, 3, 18, 5],
+            [1, 12, 20, 15, 19],
+        ],
+        [
+            [3, 15, 0, 2, 22],
+            [9, 18, 13, 17, 5],
+            [19, 8, 7, 25, 23],
+            [20, 11, 10, 24, 4],
+            [14, 21, 16, 12, 6],
+        ],
+        [
+            [14, 21, 17, 24, 4],
+            [10, 16, 15, 9, 19],
+            [18, 8, 23, 26, 20],
+            [22, 11, 13, 6, 5],
+            [2, 0, 12, 3, 7],
+        ],
+    ]
+)
+
+
+def test_play():
+    wins = list(Bingo(BOARDS).play(DRAWS))
+
+    assert [win.board for win in wins] == [2, 0, 1]
+    assert wins[0] == Win(board=2, draw=24, score=4512)
+    assert wins[-1] == Win(board=1, draw=13, score=1924)
+
+
+def test_play_column():
+    board = np.arange(25).reshape(1, 5, 5)
+
+    assert list(Bingo(board).play([0, 5, 10, 1, 15, 20])) == [Win(board=0, draw=20, score=(300 - 51) * 20)]
+
+
+def test_main_without_winner(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1,2\n\n1 3\n4 2\n")
+
+    with pytest.raises(ValueError, match="no board ever wins"):
+        main(str(input_file))
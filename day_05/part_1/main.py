@@ -1,8 +1,17 @@
+import bisect
+import collections
 import dataclasses
+import itertools
+from typing import Iterator
 
 import fire
 import numpy as np
 
+Vector = tuple[int, int]
+
+# The coordinate that runs along lines of each family, keyed by the coordinate that is constant on them.
+PARAMETERS = {(1, 0): (0, 1), (0, 1): (1, 0), (1, -1): (1, 0), (1, 1): (1, 0)}
+
 
 @dataclasses.dataclass
 class Point:
@@ -26,36 +35,128 @@ class Line:
     def is_horizontal_or_vertical(self) -> bool:
         return self.point_1.x == self.point_2.x or self.point_1.y == self.point_2.y
 
-    def draw(self, canvas: np.ndarray) -> None:
-        if self.is_horizontal_or_vertical():
-            x_min, x_max = min(self.point_1.x, self.point_2.x), max(self.point_1.x, self.point_2.x)
-            y_min, y_max = min(self.point_1.y, self.point_2.y), max(self.point_1.y, self.point_2.y)
-            canvas[x_min : x_max + 1, y_min : y_max + 1] += 1
-        else:
-            raise NotImplementedError
+    def family(self) -> Vector:
+        if self.point_1.x == self.point_2.x:
+            return 1, 0
+        if self.point_1.y == self.point_2.y:
+            return 0, 1
+        raise ValueError(f"Unexpected line {self}")
 
-    def max_x(self) -> int:
-        return max(self.point_1.x, self.point_2.x)
 
-    def max_y(self) -> int:
-        return max(self.point_1.y, self.point_2.y)
+def rasterize(lines: list[Line]) -> np.ndarray:
+    segments = np.array([dataclasses.astuple(line) for line in lines], dtype=np.int64).reshape(-1, 4)
+    x_1, y_1, x_2, y_2 = segments.T
+    step_x, step_y = np.sign(x_2 - x_1), np.sign(y_2 - y_1)
+    lengths = np.maximum(np.abs(x_2 - x_1), np.abs(y_2 - y_1)) + 1
 
+    line_ids = np.repeat(np.arange(len(segments)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    xs = x_1[line_ids] + step_x[line_ids] * offsets
+    ys = y_1[line_ids] + step_y[line_ids] * offsets
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = list(map(Line.parse_row, f.readlines()))
+    # A pixel is covered at most once per line, so the line count bounds every cell.
+    shape = (int(xs.max(initial=-1)) + 1, int(ys.max(initial=-1)) + 1)
+    canvas = np.zeros(shape, dtype=np.min_scalar_type(len(segments)))
+    np.add.at(canvas, (xs, ys), 1)
+    return canvas
+
+
+def dot(vector: Vector, point: Vector) -> int:
+    return vector[0] * point[0] + vector[1] * point[1]
+
+
+def span(line: Line, vector: Vector) -> tuple[int, int]:
+    return tuple(
+        sorted((dot(vector, dataclasses.astuple(line.point_1)), dot(vector, dataclasses.astuple(line.point_2))))
+    )
 
-    lines = [line for line in lines if line.is_horizontal_or_vertical()]
 
-    dim_x = max(line.max_x() for line in lines)
-    dim_y = max(line.max_y() for line in lines)
+def overlaps(lines: list[Line], family: Vector) -> dict[int, tuple[list[int], list[int]]]:
+    parameter = PARAMETERS[family]
+    events = collections.defaultdict(list)
+    for line in lines:
+        start, end = span(line, parameter)
+        events[dot(family, dataclasses.astuple(line.point_1))] += [(start, 1), (end + 1, -1)]
+
+    runs = {}
+    for key, key_events in events.items():
+        starts, ends, depth = [], [], 0
+        for position, change in sorted(key_events):
+            if depth < 2 <= depth + change:
+                starts.append(position)
+            elif depth + change < 2 <= depth:
+                ends.append(position - 1)
+            depth += change
+        if starts:
+            runs[key] = starts, ends
+    return runs
+
+
+def in_runs(runs: dict[int, tuple[list[int], list[int]]], family: Vector, point: Vector) -> bool:
+    if (key := dot(family, point)) not in runs:
+        return False
+    starts, ends = runs[key]
+    position = dot(PARAMETERS[family], point)
+    index = bisect.bisect_right(starts, position) - 1
+    return index >= 0 and position <= ends[index]
+
+
+def crossings(family_1: Vector, lines_1: list[Line], family_2: Vector, lines_2: list[Line]) -> Iterator[Vector]:
+    # In (family_1 . p, family_2 . p) coordinates both families are axis-aligned, so one orthogonal sweep serves all
+    # pairs of directions. The solution only lies on the lattice if it divides out exactly.
+    events = []
+    for line in lines_2:
+        key = dot(family_2, dataclasses.astuple(line.point_1))
+        start, end = span(line, family_1)
+        events += [(start, 0, key, key), (end, 2, key, key)]
+    for line in lines_1:
+        events.append((dot(family_1, dataclasses.astuple(line.point_1)), 1, *span(line, family_2)))
+    events.sort()
+
+    (a, b), (c, d) = family_1, family_2
+    determinant = a * d - b * c
+    active = []
+    for position, kind, low, high in events:
+        if kind == 0:
+            bisect.insort(active, low)
+        elif kind == 2:
+            del active[bisect.bisect_left(active, low)]
+        else:
+            for key in active[bisect.bisect_left(active, low) : bisect.bisect_right(active, high)]:
+                x, x_remainder = divmod(position * d - b * key, determinant)
+                y, y_remainder = divmod(a * key - position * c, determinant)
+                if x_remainder == 0 and y_remainder == 0:
+                    yield x, y
 
-    canvas = np.zeros(shape=(dim_x, dim_y))
 
+def count_overlaps(lines: list[Line]) -> int:
+    families = collections.defaultdict(list)
     for line in lines:
-        line.draw(canvas)
+        families[line.family()].append(line)
+
+    crossing_points = set()
+    for (family_1, lines_1), (family_2, lines_2) in itertools.combinations(families.items(), 2):
+        crossing_points.update(crossings(family_1, lines_1, family_2, lines_2))
+
+    # Points covered by a single family are counted from its runs, all others from the crossings.
+    overlap_count = len(crossing_points)
+    for family, family_lines in families.items():
+        runs = overlaps(family_lines, family)
+        overlap_count += sum(end - start + 1 for starts, ends in runs.values() for start, end in zip(starts, ends))
+        overlap_count -= sum(in_runs(runs, family, point) for point in crossing_points)
+    return overlap_count
+
+
+def main(input_file: str = "input.txt", sparse: bool = False) -> None:
+    with open(input_file) as f:
+        lines = list(map(Line.parse_row, f.readlines()))
+
+    lines = [line for line in lines if line.is_horizontal_or_vertical()]
 
-    intersection_count = len(np.where(canvas > 1)[0])
+    if sparse:
+        intersection_count = count_overlaps(lines)
+    else:
+        intersection_count = np.count_nonzero(rasterize(lines) > 1)
 
     print(intersection_count)
 
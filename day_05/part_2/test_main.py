@@ -1,6 +1,18 @@
+import numpy as np
 import pytest
 
-from main import Line, Point
+from main import Line, Point, count_overlaps, rasterize
+
+EXAMPLE = """0,9 -> 5,9
+8,0 -> 0,8
+9,4 -> 3,4
+2,2 -> 2,1
+7,0 -> 7,4
+6,4 -> 2,0
+0,9 -> 2,9
+3,4 -> 1,4
+0,0 -> 8,8
+5,5 -> 8,2"""
 
 
 @pytest.mark.parametrize(
@@ -25,3 +37,38 @@ def test_is_45_degrees(line, expected):
 )
 def test_is_135_degrees(line, expected):
     assert line.is_135_degrees() == expected
+
+
+def test_rasterize():
+    lines = list(map(Line.parse_row, EXAMPLE.splitlines()))
+
+    canvas = rasterize(lines)
+
+    assert canvas.shape == (10, 10)
+    assert canvas.dtype == np.uint8
+    assert canvas[9, 4] == 1
+    assert np.count_nonzero(canvas > 1) == 12
+    assert np.count_nonzero(rasterize([line for line in lines if line.is_horizontal_or_vertical()]) > 1) == 5
+
+
+def test_count_overlaps():
+    rng = np.random.default_rng(5)
+    lines = []
+    for x, y, length, direction in zip(
+        *rng.integers(0, 30, (2, 300)), rng.integers(0, 12, 300), rng.integers(0, 4, 300)
+    ):
+        step_x, step_y = [(1, 0), (0, 1), (1, 1), (1, -1)][direction]
+        lines.append(Line(Point(x, y + 15), Point(x + step_x * length, y + 15 + step_y * length)))
+
+    assert count_overlaps(lines) == np.count_nonzero(rasterize(lines) > 1)
+
+
+def test_count_overlaps_huge_coordinates():
+    lines = [
+        Line(Point(0, 0), Point(10**9, 10**9)),
+        Line(Point(10**9, 0), Point(0, 10**9)),
+        Line(Point(0, 10**9 // 2), Point(10**9, 10**9 // 2)),
+        Line(Point(10**6, 10**6), Point(3 * 10**6, 3 * 10**6)),
+    ]
+
+    assert count_overlaps(lines) == 2 * 10**6 + 2
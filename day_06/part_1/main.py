@@ -1,25 +1,58 @@
+import functools
 from collections import Counter
+from typing import Iterable, Optional
 
 import fire
 
+TIMER_COUNT = 9
+# TRANSITION[target][source] counts the fish with timer target that one fish with timer source becomes in a generation.
+TRANSITION = tuple(
+    tuple(int(source == target + 1 or (source == 0 and target in (6, 8))) for source in range(TIMER_COUNT))
+    for target in range(TIMER_COUNT)
+)
 
-def next_step(data: dict) -> dict:
-    next_data = {k - 1: v for k, v in data.items()}
-    next_data[8] = next_data.get(-1, 0)
-    next_data[6] = next_data.get(6, 0) + next_data.get(-1, 0)
-    if -1 in next_data:
-        del next_data[-1]
-    return next_data
+Matrix = tuple[tuple[int, ...], ...]
 
 
-def main(generation_count: int = 80, input_file: str = "input.txt") -> None:
+def multiply(left: Matrix, right: Matrix, modulus: Optional[int] = None) -> Matrix:
+    product = tuple(tuple(sum(a * b for a, b in zip(row, column)) for column in zip(*right)) for row in left)
+    if modulus is None:
+        return product
+    return tuple(tuple(value % modulus for value in row) for row in product)
+
+
+@functools.lru_cache(maxsize=None)
+def transition_power(bit: int, modulus: Optional[int] = None) -> Matrix:
+    if bit == 0:
+        return TRANSITION
+    previous = transition_power(bit - 1, modulus)
+    return multiply(previous, previous, modulus)
+
+
+@functools.lru_cache(maxsize=256)
+def descendants(generation_count: int, modulus: Optional[int] = None) -> tuple[int, ...]:
+    row = ((1,) * TIMER_COUNT,)
+    for bit in range(generation_count.bit_length()):
+        if generation_count >> bit & 1:
+            row = multiply(row, transition_power(bit, modulus), modulus)
+    return row[0]
+
+
+def population(data: dict[int, int], generation_count: int, modulus: Optional[int] = None) -> int:
+    row = descendants(generation_count, modulus)
+    total = sum(row[timer] * count for timer, count in data.items())
+    return total if modulus is None else total % modulus
+
+
+def populations(queries: Iterable[tuple[dict[int, int], int]], modulus: Optional[int] = None) -> list[int]:
+    return [population(data, generation_count, modulus) for data, generation_count in queries]
+
+
+def main(generation_count: int = 80, input_file: str = "input.txt", modulus: Optional[int] = None) -> None:
     with open(input_file) as f:
         data = Counter(map(int, f.read().split(",")))
 
-    for _ in range(generation_count):
-        data = next_step(data)
-
-    print(sum(data.values()))
+    print(population(data, generation_count, modulus))
 
 
 if __name__ == "__main__":
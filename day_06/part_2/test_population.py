@@ -0,0 +1,37 @@
+from collections import Counter
+
+import pytest
+
+from main import population, populations
+
+EXAMPLE = Counter([3, 4, 3, 1, 2])
+
+
+def simulate(data: dict[int, int], generation_count: int) -> int:
+    timers = list(Counter(data).elements())
+    for _ in range(generation_count):
+        spawned = timers.count(0)
+        timers = [6 if timer == 0 else timer - 1 for timer in timers] + [8] * spawned
+    return len(timers)
+
+
+@pytest.mark.parametrize(
+    "generation_count, expected",
+    [(0, 5), (1, 5), (18, 26), (80, 5934), (256, 26984457539)],
+)
+def test_population(generation_count, expected):
+    assert population(EXAMPLE, generation_count) == expected
+
+
+@pytest.mark.parametrize("generation_count", range(40))
+def test_population_matches_simulation(generation_count):
+    assert population(EXAMPLE, generation_count) == simulate(EXAMPLE, generation_count)
+
+
+def test_populations():
+    queries = [(EXAMPLE, 80), ({0: 1}, 1), ({8: 2, 0: 1}, 256), (EXAMPLE, 80)]
+
+    assert populations(queries) == [population(data, generation_count) for data, generation_count in queries]
+    assert populations(queries, modulus=97) == [
+        population(data, generation_count) % 97 for data, generation_count in queries
+    ]
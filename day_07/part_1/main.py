@@ -1,24 +1,52 @@
+from typing import Callable
+
 import fire
 import numpy as np
-from matplotlib import pyplot as plt
-from tqdm import trange
 
 
 def calculate_cost(data: np.ndarray, target_position: int) -> int:
     return int(np.sum(np.abs(data - target_position)))
 
 
-def main(input_file: str = "input.txt") -> None:
+def optimal_position(data: np.ndarray) -> int:
+    middle = (len(data) - 1) // 2
+    return int(np.partition(data, middle)[middle])
+
+
+def cost_curve(data: np.ndarray) -> np.ndarray:
+    positions = np.arange(np.min(data), np.max(data) + 1)
+    counts = np.bincount(data - np.min(data))
+    count_up_to = np.cumsum(counts)
+    sum_up_to = np.cumsum(counts * positions)
+    return positions * count_up_to - sum_up_to + (sum_up_to[-1] - sum_up_to) - positions * (len(data) - count_up_to)
+
+
+def minimize_convex(data: np.ndarray, cost: Callable[[np.ndarray], np.ndarray]) -> tuple[int, int]:
+    def total(position: int) -> int:
+        return int(np.sum(cost(np.abs(data - position))))
+
+    low, high = int(np.min(data)), int(np.max(data))
+    while low < high:
+        middle = (low + high) // 2
+        if total(middle + 1) >= total(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low, total(low)
+
+
+def main(input_file: str = "input.txt", plot: bool = False) -> None:
     with open(input_file) as f:
         data = np.array(f.read().split(","), dtype=int)
 
-    min_pos = int(np.median(data))
-    cost = calculate_cost(data, min_pos)
+    cost = calculate_cost(data, optimal_position(data))
     print(cost)
 
-    costs = [calculate_cost(data, i) for i in trange(min(data), max(data))]
-    plt.plot(costs)
-    plt.show()
+    if plot:
+        from matplotlib import pyplot as plt
+
+        plt.plot(np.arange(np.min(data), np.max(data) + 1), cost_curve(data))
+        plt.show()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from main import calculate_cost
+from main import calculate_cost, cost_curve, minimize_convex, optimal_position
 
 
 @pytest.mark.parametrize(
@@ -13,3 +13,19 @@ from main import calculate_cost
 )
 def test_calculate_cost(data, target, expected):
     assert calculate_cost(data, target) == expected
+
+
+def test_optimal_position():
+    data = np.array([16, 1, 2, 0, 4, 2, 7, 1, 2, 14])
+
+    assert optimal_position(data) == 5
+    assert minimize_convex(data, lambda distances: distances * (distances + 1) // 2) == (5, 168)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cost_curve(seed):
+    data = np.random.default_rng(seed).integers(0, 100, size=50)
+    curve = cost_curve(data)
+
+    assert list(curve) == [calculate_cost(data, position) for position in range(np.min(data), np.max(data) + 1)]
+    assert calculate_cost(data, optimal_position(data)) == np.min(curve)
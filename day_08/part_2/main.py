@@ -1,75 +1,93 @@
-import functools
-import operator
-from collections import Counter
-from typing import Iterable
+from typing import Generator, Iterable
 
 import fire
+import numpy as np
 
-NUMBER_MAPPING = {
-    pattern: str(idx)
-    for idx, pattern in enumerate(
-        [
-            frozenset("abcefg"),
-            frozenset("cf"),
-            frozenset("acdeg"),
-            frozenset("acdfg"),
-            frozenset("bcdf"),
-            frozenset("abdfg"),
-            frozenset("abdefg"),
-            frozenset("acf"),
-            frozenset("abcdefg"),
-            frozenset("abcdfg"),
-        ]
-    )
-}
-FILTER_MAP = {
-    "a": ({2, 4}, 8),  # This means that if we remove codes with lengths 2 or 4, the letter "a" will have a count of 8
-    "b": (set(), 6),  # This means that if we remove no codes, the letter "b" will have a count of 6
-    "c": ({5}, 6),
-    "d": ({4}, 6),
-    "e": (set(), 4),
-    "f": (set(), 9),
-    "g": ({6}, 4),
-}
-
-
-def count_chars(patterns: Iterable[set[str]]) -> dict[int, str]:
-    counts = functools.reduce(
-        operator.add,
-        map(Counter, patterns),
-    )
-    return {v: k for k, v in counts.items()}
+DIGIT_SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+ENTRY_SIZE = 14
 
-
-def find_mapping(patterns: list[set[str]]) -> dict[str, str]:
-    mapping = {}
-    for char, (filter_set, count) in FILTER_MAP.items():
-        filtered_patterns = filter(lambda p: len(p) not in filter_set, patterns)
-        counts = count_chars(filtered_patterns)
-        mapping[counts[count]] = char
-    return mapping
+LETTER_BITS = np.zeros(256, dtype=np.uint8)
+LETTER_BITS[np.frombuffer(b"abcdefg", dtype=np.uint8)] = 1 << np.arange(7)
+POPCOUNT = np.array([bin(mask).count("1") for mask in range(128)], dtype=np.uint8)
 
 
-def get_number_str(code: str) -> str:
-    return NUMBER_MAPPING[frozenset(code)]
+def encode_pattern(pattern: Iterable[str]) -> int:
+    return sum(1 << (ord(char) - ord("a")) for char in set(pattern))
 
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
+def build_digit_table() -> np.ndarray:
+    # 1 and 4 are the only digits with two and four segments. Every digit is told apart by its segment count and the
+    # number of segments it shares with them, whatever the wiring.
+    one, four = encode_pattern(DIGIT_SEGMENTS[1]), encode_pattern(DIGIT_SEGMENTS[4])
+    table = np.full((8, 3, 5), -1, dtype=np.int8)
+    for digit, segments in enumerate(DIGIT_SEGMENTS):
+        mask = encode_pattern(segments)
+        table[POPCOUNT[mask], POPCOUNT[mask & one], POPCOUNT[mask & four]] = digit
+    return table
 
-    lines = [(list(map(set, left.split(" "))), right) for left, right in [line.split(" | ") for line in lines]]
 
-    total = 0
-    for pattern, code in lines:
-        mapping = find_mapping(pattern)
+DIGIT_TABLE = build_digit_table()
 
-        translated = "".join(map(lambda c: mapping.get(c, " "), code))
 
-        number_str = ""
-        for translated_part in translated.split(" "):
-            number_str += get_number_str(translated_part)
-        total += int(number_str)
+def find_mapping(patterns: list[set[str]]) -> dict[str, str]:
+    masks = [encode_pattern(pattern) for pattern in patterns]
+    (one,), (seven,), (four,), (eight,) = [[mask for mask in masks if POPCOUNT[mask] == size] for size in (2, 3, 4, 7)]
+    sixes = [mask for mask in masks if POPCOUNT[mask] == 6]
+    nine = next(mask for mask in sixes if mask & four == four)
+    zero = next(mask for mask in sixes if mask != nine and mask & one == one)
+    six = next(mask for mask in sixes if mask not in (nine, zero))
+
+    segments = {
+        "a": seven & ~one,
+        "b": four & ~one & zero,
+        "c": eight & ~six,
+        "d": eight & ~zero,
+        "e": eight & ~nine,
+        "f": one & six,
+        "g": nine & ~(four | seven),
+    }
+    return {chr(ord("a") + mask.bit_length() - 1): segment for segment, mask in segments.items()}
+
+
+def encode(chunk: bytes) -> np.ndarray:
+    bits = LETTER_BITS[np.frombuffer(chunk, dtype=np.uint8)]
+    is_letter = bits > 0
+    starts = np.flatnonzero(is_letter & ~np.concatenate(([False], is_letter[:-1])))
+    masks = np.bitwise_or.reduceat(bits, starts)
+    if masks.size % ENTRY_SIZE:
+        raise ValueError(f"Unexpected number of patterns {masks.size}, expected a multiple of {ENTRY_SIZE}")
+    return masks.reshape(-1, ENTRY_SIZE)
+
+
+def read_entries(input_file: str, chunk_size: int = 2**20) -> Generator[np.ndarray, None, None]:
+    with open(input_file, "rb") as f:
+        remainder = b""
+        while chunk := f.read(chunk_size):
+            chunk = remainder + chunk
+            cut = chunk.rfind(b"\n") + 1
+            chunk, remainder = chunk[:cut], chunk[cut:]
+            if chunk.strip():
+                yield encode(chunk)
+        if remainder.strip():
+            yield encode(remainder)
+
+
+def decode(entries: np.ndarray) -> np.ndarray:
+    patterns, outputs = entries[:, :10], entries[:, 10:]
+    counts = POPCOUNT[patterns]
+    if np.any(np.count_nonzero(counts == 2, axis=1) != 1) or np.any(np.count_nonzero(counts == 4, axis=1) != 1):
+        raise ValueError("Unexpected patterns without a unique 1 and 4")
+
+    one = patterns[counts == 2][:, np.newaxis]
+    four = patterns[counts == 4][:, np.newaxis]
+    digits = DIGIT_TABLE[POPCOUNT[outputs], POPCOUNT[outputs & one], POPCOUNT[outputs & four]]
+    if np.any(digits < 0):
+        raise ValueError("Unexpected output pattern")
+    return digits.astype(np.int64) @ np.array([1000, 100, 10, 1])
+
+
+def main(input_file: str = "input.txt", chunk_size: int = 2**20) -> None:
+    total = sum(int(decode(entries).sum()) for entries in read_entries(input_file, chunk_size))
 
     print(total)
 
@@ -1,4 +1,16 @@
-from main import find_mapping
+from main import DIGIT_SEGMENTS, decode, encode, find_mapping
+
+EXAMPLE = b"""be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
+edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
+fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg
+fbegcd cbd adcefb dageb afcb bc aefdc ecdab fgdeca fcdbega | efabcd cedba gadfec cb
+aecbfdg fbg gf bafeg dbefa fcge gcbea fcaegb dgceab fcbdga | gecf egdcabf bgf bfgea
+fgeab ca afcebg bdacfeg cfaedg gcfdb baec bfadeg bafgc acf | gebdcfa ecba ca fadegcb
+dbcfg fgd bdegcaf fgec aegbdf ecdfab fbedc dacgb gdcebf gf | cefg dcbef fcge gbcadfe
+bdfegc cbegaf gecbf dfcage bdacg ed bedf ced adcbefg gebcd | ed bcgafe cdgba cbgef
+egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | gbdfcae bgc cg cgb
+gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce
+"""
 
 
 def test_find_mapping():
@@ -24,3 +36,19 @@ def test_find_mapping():
         "b": "f",
         "c": "g",
     }
+
+
+def test_decode():
+    values = decode(encode(EXAMPLE))
+
+    assert values.tolist() == [8394, 9781, 1197, 9361, 4873, 8418, 4548, 1625, 8717, 4315]
+
+
+def test_decode_matches_find_mapping():
+    entries = encode(EXAMPLE)
+    for line, value in zip(EXAMPLE.decode().splitlines(), decode(entries)):
+        patterns, outputs = [part.split(" ") for part in line.split(" | ")]
+        mapping = find_mapping(list(map(set, patterns)))
+        digits = [DIGIT_SEGMENTS.index("".join(sorted(mapping[char] for char in output))) for output in outputs]
+
+        assert int("".join(map(str, digits))) == value
@@ -1,30 +1,49 @@
 import timeit
+from typing import Generator
 
 import fire
 import numpy as np
 
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
-
-    data = np.array([list(line) for line in lines], dtype=np.int8)
-
-    col = np.full((len(data), 1), 10, dtype=np.int8)
-    row = np.full((1, len(data)), 10, dtype=np.int8)
-
-    shift_up = np.concatenate((data[1:, :], row))
-    shift_down = np.concatenate((row, data[:-1, :]))
+def load_digits(input_file: str) -> np.ndarray:
+    with open(input_file, "rb") as f:
+        first_line = f.readline()
+    width = len(first_line.rstrip(b"\r\n"))
+    terminator = len(first_line) - width
+    raw = np.memmap(input_file, dtype=np.uint8, mode="r")
+    stride = width + terminator
+    row_count = (raw.size + terminator) // stride
+    if raw.size not in (row_count * stride, row_count * stride - terminator):
+        raise ValueError(f"Unexpected height map of {raw.size} bytes for rows of width {width}")
+    # A view of the file without the line terminators, so bands are only read from disk when they are used.
+    return np.lib.stride_tricks.as_strided(raw, shape=(row_count, width), strides=(stride, 1), writeable=False)
+
+
+def bands(digits: np.ndarray, band_rows: int) -> Generator[np.ndarray, None, None]:
+    # Each band carries one row of its neighbours above and below, or a wall of 10s at the edges of the map.
+    wall = np.full((1, digits.shape[1]), 10, dtype=np.int8)
+    for start in range(0, len(digits), band_rows):
+        stop = min(start + band_rows, len(digits))
+        rows = (digits[max(start - 1, 0) : stop + 1] - ord("0")).astype(np.int8)
+        yield np.concatenate(([wall] if start == 0 else []) + [rows] + ([wall] if stop == len(digits) else []))
+
+
+def low_points(heights: np.ndarray) -> np.ndarray:
+    padded = np.pad(heights, 1, constant_values=10)
+    center = padded[1:-1, 1:-1]
+    return (
+        (padded[:-2, 1:-1] > center)
+        & (padded[2:, 1:-1] > center)
+        & (padded[1:-1, :-2] > center)
+        & (padded[1:-1, 2:] > center)
+    )
 
-    shift_left = np.concatenate((data[:, 1:], col), axis=-1)
-    shift_right = np.concatenate((col, data[:, :-1]), axis=-1)
 
-    result = np.logical_and(
-        np.logical_and((shift_down - data) > 0, (shift_up - data) > 0),
-        np.logical_and((shift_right - data) > 0, (shift_left - data) > 0),
-    )
+def main(input_file: str = "input.txt", band_rows: int = 1024) -> None:
+    total = 0
+    for band in bands(load_digits(input_file), band_rows):
+        total += int(np.sum(band[1:-1][low_points(band)[1:-1]] + 1))
 
-    total = np.sum(data[result] + 1)
     print(total)
 
 
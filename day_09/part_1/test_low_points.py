@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from main import bands, load_digits, low_points
+
+EXAMPLE = ["2199943210", "3987894921", "9856789892", "8767896789", "9899965678"]
+
+
+def test_low_points():
+    heights = np.array([list(line) for line in EXAMPLE], dtype=np.int8)
+
+    assert np.argwhere(low_points(heights)).tolist() == [[0, 1], [0, 9], [2, 2], [4, 6]]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_load_digits(tmp_path, newline, trailing_newline):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes((newline.join(EXAMPLE) + (newline if trailing_newline else "")).encode())
+
+    digits = load_digits(input_file)
+
+    assert digits.shape == (5, 10)
+    assert bytes(digits[-1]) == EXAMPLE[-1].encode()
+    assert bytes(digits[0]) == EXAMPLE[0].encode()
+
+
+@pytest.mark.parametrize("band_rows", [1, 2, 5])
+def test_bands(tmp_path, band_rows):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("\n".join(EXAMPLE))
+
+    total = sum(
+        int(np.sum(band[1:-1][low_points(band)[1:-1]] + 1)) for band in bands(load_digits(input_file), band_rows)
+    )
+
+    assert total == 15
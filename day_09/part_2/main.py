@@ -1,80 +1,57 @@
-import dataclasses
-import functools
-import operator
 import timeit
+from typing import Generator, Iterable
 
 import fire
 import numpy as np
-
-
-@dataclasses.dataclass(unsafe_hash=True)
-class Point:
-    x: int
-    y: int
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def is_valid(self, grid: np.ndarray) -> bool:
-        return 0 <= self.x < grid.shape[0] and 0 <= self.y < grid.shape[1]
-
-
-@dataclasses.dataclass
-class Basin:
-    center: Point
-    container: set[Point] = dataclasses.field(default_factory=set)
-
-    def __post_init__(self):
-        self.container.add(self.center)
-
-    @property
-    def size(self):
-        return len(self.container)
-
-    def grow(self, grid: np.ndarray):
-        queue = [self.center]
-
-        while queue:
-            point = queue.pop(0)
-            for offset in [Point(-1, 0), Point(1, 0), Point(0, -1), Point(0, 1)]:
-                candidate = point + offset
-                if candidate.is_valid(grid) and grid[candidate.x, candidate.y] != 9 and candidate not in self.container:
-                    self.container.add(candidate)
-                    queue.append(candidate)
-
-
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
-
-    data = np.array([list(line) for line in lines], dtype=np.int8)
-
-    col = np.full((len(data), 1), 10, dtype=np.int8)
-    row = np.full((1, len(data)), 10, dtype=np.int8)
-
-    shift_up = np.concatenate((data[1:, :], row))
-    shift_down = np.concatenate((row, data[:-1, :]))
-
-    shift_left = np.concatenate((data[:, 1:], col), axis=-1)
-    shift_right = np.concatenate((col, data[:, :-1]), axis=-1)
-
-    result = np.logical_and(
-        np.logical_and((shift_down - data) > 0, (shift_up - data) > 0),
-        np.logical_and((shift_right - data) > 0, (shift_left - data) > 0),
-    )
-
-    low_points = np.where(result)
-
-    sizes = []
-    for x, y in zip(*low_points):
-        basin = Basin(center=Point(x, y))
-        basin.grow(data)
-        sizes.append(basin.size)
-
-    print(functools.reduce(operator.mul, sorted(sizes, reverse=True)[:3]))
+from scipy.ndimage import label
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+def load_digits(input_file: str) -> np.ndarray:
+    with open(input_file, "rb") as f:
+        first_line = f.readline()
+    width = len(first_line.rstrip(b"\r\n"))
+    terminator = len(first_line) - width
+    raw = np.memmap(input_file, dtype=np.uint8, mode="r")
+    stride = width + terminator
+    row_count = (raw.size + terminator) // stride
+    if raw.size not in (row_count * stride, row_count * stride - terminator):
+        raise ValueError(f"Unexpected height map of {raw.size} bytes for rows of width {width}")
+    # A view of the file without the line terminators, so bands are only read from disk when they are used.
+    return np.lib.stride_tricks.as_strided(raw, shape=(row_count, width), strides=(stride, 1), writeable=False)
+
+
+def bands(digits: np.ndarray, band_rows: int) -> Generator[np.ndarray, None, None]:
+    for start in range(0, len(digits), band_rows):
+        yield (digits[start : start + band_rows] - ord("0")).astype(np.int8)
+
+
+def basin_sizes(bands: Iterable[np.ndarray]) -> np.ndarray:
+    # Basins are exactly the 4-connected regions below height 9. Each band is labeled on its own, and labels that touch
+    # across a band border are joined afterwards, so only one band and one border row are held at a time.
+    sizes, links = [], []
+    label_count, previous_row = 0, None
+    for heights in bands:
+        labels, count = label(heights != 9)
+        sizes.append(np.bincount(labels.ravel(), minlength=count + 1)[1:])
+
+        first_row, last_row = [np.where(row > 0, row.astype(np.int64) + label_count - 1, -1) for row in labels[[0, -1]]]
+        if previous_row is not None:
+            touching = (previous_row >= 0) & (first_row >= 0)
+            links.append(np.stack((previous_row[touching], first_row[touching])))
+        label_count, previous_row = label_count + count, last_row
+
+    links = np.concatenate(links, axis=1) if links else np.empty((2, 0), dtype=np.int64)
+    graph = coo_matrix((np.ones(links.shape[1]), (links[0], links[1])), shape=(label_count, label_count))
+    _, basins = connected_components(graph, directed=False)
+    return np.bincount(basins, weights=np.concatenate(sizes)).astype(np.int64)
+
+
+def main(input_file: str = "input.txt", band_rows: int = 1024) -> None:
+    sizes = basin_sizes(bands(load_digits(input_file), band_rows))
+
+    print(np.prod(np.sort(sizes)[-3:]))
 
 
 if __name__ == "__main__":
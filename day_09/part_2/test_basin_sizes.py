@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from main import bands, basin_sizes, load_digits
+
+EXAMPLE = ["2199943210", "3987894921", "9856789892", "8767896789", "9899965678"]
+
+
+def test_basin_sizes():
+    heights = np.array([list(line) for line in EXAMPLE], dtype=np.int8)
+
+    assert sorted(basin_sizes([heights])) == [3, 9, 9, 14]
+
+
+def test_basin_sizes_ignores_diagonals():
+    heights = np.array([[1, 9], [9, 1]], dtype=np.int8)
+
+    assert basin_sizes([heights]).tolist() == [1, 1]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("band_rows", [1, 2, 3, 5])
+def test_basin_sizes_merges_bands(tmp_path, band_rows, newline):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(newline.join(EXAMPLE).encode())
+
+    assert sorted(basin_sizes(bands(load_digits(input_file), band_rows))) == [3, 9, 9, 14]
+
+
+def test_basin_sizes_merges_labels_across_several_bands():
+    heights = np.array([[1, 9, 1], [1, 9, 1], [1, 1, 1], [9, 9, 1]], dtype=np.int8)
+
+    assert basin_sizes(np.split(heights, 4)).tolist() == [8]
@@ -1,31 +1,54 @@
-import functools
-import operator
 import timeit
+from typing import Generator, Iterable
 
 import fire
 
-POINT_MAP = {")": 3, "]": 57, "}": 1197, ">": 25137}
-CORRESPONDING_CHARS = {")": "(", "]": "[", "}": "{", ">": "<"}
+OPENING, CLOSING = b"([{<", b")]}>"
+CORRUPTION_POINTS = (0, 3, 57, 1197, 25137)
 
 
-def judge_line(line: str) -> int:
-    stack = []
-    for char in line:
-        if char in CORRESPONDING_CHARS.values():
-            stack.append(char)
-            continue
-        if stack.pop() == CORRESPONDING_CHARS[char]:
-            continue
+def build_translation() -> bytes:
+    # Opening brackets translate to their kind 1-4 and closing brackets to 5-8, every other byte to 0.
+    table = bytearray(256)
+    for kind, (opening, closing) in enumerate(zip(OPENING, CLOSING), start=1):
+        table[opening], table[closing] = kind, kind + len(OPENING)
+    return bytes(table)
 
-        return POINT_MAP[char]
-    return 0
+
+TRANSLATION = build_translation()
+
+
+def score_lines(lines: Iterable[bytes]) -> Generator[tuple[int, int], None, None]:
+    stack = bytearray(256)
+    for line in lines:
+        line = line.rstrip(b"\r\n")
+        if len(line) > len(stack):
+            stack = bytearray(2 * len(line))
+
+        depth, corruption = 0, 0
+        for code in line.translate(TRANSLATION):
+            if code == 0:
+                raise ValueError(f"Unexpected character in line {line.decode()}")
+            if code <= len(OPENING):
+                stack[depth] = code
+                depth += 1
+            elif depth > 0 and stack[depth - 1] == code - len(OPENING):
+                depth -= 1
+            else:
+                corruption = CORRUPTION_POINTS[code - len(OPENING)]
+                break
+
+        completion = 0
+        if not corruption:
+            for kind in reversed(stack[:depth]):
+                completion = 5 * completion + kind
+        yield corruption, completion
 
 
 def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
+    with open(input_file, "rb") as f:
+        points = sum(corruption for corruption, _ in score_lines(f))
 
-    points = functools.reduce(operator.add, map(judge_line, lines))
     print(points)
 
 
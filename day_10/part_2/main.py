@@ -1,55 +1,97 @@
+import os
 import timeit
+from typing import Generator, Iterable
 
 import fire
-
-POINT_MAP = {c: i for i, c in enumerate(")]}>", start=1)}
-CORRESPONDING_CHARS = {")": "(", "]": "[", "}": "{", ">": "<"}
-INVERSE_CORRESPONDING_CHARS = {v: k for k, v in CORRESPONDING_CHARS.items()}
-
-
-def is_valid(line: str) -> bool:
-    stack = []
-    for char in line:
-        if char in CORRESPONDING_CHARS.values():
-            stack.append(char)
-            continue
-        if stack.pop() == CORRESPONDING_CHARS[char]:
-            continue
-
-        return False
-    return True
-
-
-def check_missing(line: str) -> int:
-    buffer = {c: 0 for c in ")]}>"}
-    missing = []
-
-    for char in reversed(line):
-        if char in buffer:
-            buffer[char] += 1
-            continue
-
-        if buffer[INVERSE_CORRESPONDING_CHARS[char]] > 0:
-            buffer[INVERSE_CORRESPONDING_CHARS[char]] -= 1
-            continue
-
-        missing.append(INVERSE_CORRESPONDING_CHARS[char])
-
-    total = 0
-    for char in missing:
-        total *= 5
-        total += POINT_MAP[char]
-
-    return total
-
-
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
-
-    points = sorted(map(check_missing, filter(is_valid, lines)))
-
-    print(points[len(points) // 2])
+import numpy as np
+
+OPENING, CLOSING = b"([{<", b")]}>"
+CORRUPTION_POINTS = (0, 3, 57, 1197, 25137)
+
+
+def build_translation() -> bytes:
+    # Opening brackets translate to their kind 1-4 and closing brackets to 5-8, every other byte to 0.
+    table = bytearray(256)
+    for kind, (opening, closing) in enumerate(zip(OPENING, CLOSING), start=1):
+        table[opening], table[closing] = kind, kind + len(OPENING)
+    return bytes(table)
+
+
+TRANSLATION = build_translation()
+
+
+def score_lines(lines: Iterable[bytes]) -> Generator[tuple[int, int], None, None]:
+    stack = bytearray(256)
+    for line in lines:
+        line = line.rstrip(b"\r\n")
+        if len(line) > len(stack):
+            stack = bytearray(2 * len(line))
+
+        depth, corruption = 0, 0
+        for code in line.translate(TRANSLATION):
+            if code == 0:
+                raise ValueError(f"Unexpected character in line {line.decode()}")
+            if code <= len(OPENING):
+                stack[depth] = code
+                depth += 1
+            elif depth > 0 and stack[depth - 1] == code - len(OPENING):
+                depth -= 1
+            else:
+                corruption = CORRUPTION_POINTS[code - len(OPENING)]
+                break
+
+        completion = 0
+        if not corruption:
+            for kind in reversed(stack[:depth]):
+                completion = 5 * completion + kind
+        yield corruption, completion
+
+
+def chunk_bounds(input_file: str, chunk_size: int) -> list[int]:
+    bounds = [0]
+    with open(input_file, "rb") as f:
+        for offset in range(chunk_size, os.path.getsize(input_file), chunk_size):
+            # Chunks start right after a newline, so no line is split between two of them.
+            f.seek(offset - 1)
+            f.readline()
+            if f.tell() > bounds[-1]:
+                bounds.append(f.tell())
+    return bounds + [os.path.getsize(input_file)]
+
+
+def read_lines(input_file: str, start: int, stop: int) -> Generator[bytes, None, None]:
+    with open(input_file, "rb") as f:
+        f.seek(start)
+        while start < stop and (line := f.readline()):
+            start += len(line)
+            yield line
+
+
+def score_chunk(input_file: str, start: int, stop: int) -> np.ndarray:
+    scores = [
+        completion for corruption, completion in score_lines(read_lines(input_file, start, stop)) if not corruption
+    ]
+    # Lines left more than 27 brackets deep overflow 64 bits, so only then the scores stay Python integers.
+    return np.array(scores, dtype=np.uint64 if max(scores, default=0) < 2**64 else object)
+
+
+def completion_scores(input_file: str, chunk_size: int = 2**26, n_jobs: int = 1) -> np.ndarray:
+    bounds = chunk_bounds(input_file, chunk_size)
+    if n_jobs == 1:
+        chunks = [score_chunk(input_file, start, stop) for start, stop in zip(bounds, bounds[1:])]
+    else:
+        from joblib import Parallel, delayed
+
+        chunks = Parallel(n_jobs=n_jobs)(
+            delayed(score_chunk)(input_file, start, stop) for start, stop in zip(bounds, bounds[1:])
+        )
+    return np.concatenate(chunks)
+
+
+def main(input_file: str = "input.txt", chunk_size: int = 2**26, n_jobs: int = 1) -> None:
+    points = completion_scores(input_file, chunk_size, n_jobs)
+
+    print(np.partition(points, len(points) // 2)[len(points) // 2])
 
 
 if __name__ == "__main__":
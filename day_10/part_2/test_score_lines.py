@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from main import completion_scores, score_lines
+
+EXAMPLE = b"""[({(<(())[]>[[{[]{<()<>>
+[(()[<>])]({[<{<<[]>>(
+{([(<{}[<>[]}>{[]{[(<()>
+(((({<>}<{<{<>}{[]{[]{}
+[[<[([]))<([[{}[[()]]]
+[{[{({}]{}}([{[{{{}}([]
+{<[[]]>}<{[{[{[]{()[[[]
+[<(<(<(<{}))><([]([]()
+<{([([[(<>()){}]>(<<{{
+<{([{{}}[<[[[<>{}]]]>[]]
+"""
+
+
+def test_score_lines():
+    scores = list(score_lines(EXAMPLE.splitlines(keepends=True)))
+
+    assert [corruption for corruption, _ in scores] == [0, 0, 1197, 0, 3, 57, 0, 3, 25137, 0]
+    assert [completion for corruption, completion in scores if not corruption] == [288957, 5566, 1480781, 995444, 294]
+
+
+def test_score_lines_grows_stack():
+    line = b"(" * 1000 + b"]"
+
+    assert list(score_lines([line, b"(" * 1000])) == [(57, 0), (0, sum(5**i for i in range(1000)))]
+
+
+def test_score_lines_rejects_unexpected_characters():
+    with pytest.raises(ValueError):
+        list(score_lines([b"(a)"]))
+
+
+@pytest.mark.parametrize("chunk_size, n_jobs", [(2**26, 1), (1, 1), (37, 2)])
+def test_completion_scores(tmp_path, chunk_size, n_jobs):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(EXAMPLE)
+
+    scores = completion_scores(input_file, chunk_size, n_jobs)
+
+    assert sorted(scores.tolist()) == [294, 5566, 288957, 995444, 1480781]
+    assert np.partition(scores, len(scores) // 2)[len(scores) // 2] == 288957
+
+
+def test_completion_scores_beyond_64_bits(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"<" * 40 + b"\n()\n")
+
+    assert completion_scores(input_file, chunk_size=8).tolist() == [4 * sum(5**i for i in range(40)), 0]
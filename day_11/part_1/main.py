@@ -1,17 +1,22 @@
 import time
 import timeit
 from contextlib import nullcontext
+from typing import Optional, Union
 
 import fire
-import matplotlib.pyplot as plt
 import numpy as np
+from scipy.ndimage import convolve
 from tqdm import trange
 
+KERNEL = np.ones((3, 3), dtype=int)
+
 
 def main(input_file: str = "input.txt", plot: bool = False) -> None:
     data = np.genfromtxt(input_file, dtype=int, delimiter=1)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         cm = plt.ion()
     else:
         cm = nullcontext()
@@ -40,21 +45,45 @@ def main(input_file: str = "input.txt", plot: bool = False) -> None:
         print(f"{total_flashes=}")
 
 
-def next_iteration(data: np.array) -> tuple[np.ndarray, int]:
-    flashed = np.zeros(data.shape, dtype=bool)
+def next_iteration(data: np.ndarray) -> tuple[np.ndarray, Union[int, np.ndarray]]:
+    kernel = KERNEL.reshape((1,) * (data.ndim - 2) + KERNEL.shape)
     data += 1
-    plt.pause(0.1)
-    flashed[data > 9] = True
-    # noinspection PyTypeChecker
-    to_process: list[tuple[int, int]] = list(zip(*np.where(flashed)))
-    while to_process:
-        x, y = to_process.pop(0)
-        data[max(x - 1, 0) : min(x + 2, 10), max(y - 1, 0) : min(y + 2, 10)] += 1
-        new_flashes = (data > 9) & ~flashed
-        to_process.extend(zip(*np.where(new_flashes)))
+    flashed = np.zeros(data.shape, dtype=bool)
+    new_flashes = data > 9
+    while np.any(new_flashes):
         flashed |= new_flashes
+        data += convolve(new_flashes.astype(data.dtype), kernel, mode="constant", cval=0)
+        new_flashes = (data > 9) & ~flashed
     data[flashed] = 0
-    return data, int(np.sum(flashed))
+    flashes = np.sum(flashed, axis=(-2, -1))
+    return data, int(flashes) if data.ndim == 2 else flashes
+
+
+def simulate(grids: np.ndarray, steps: Optional[int] = None) -> tuple[np.ndarray, np.ndarray]:
+    flash_counts = np.zeros(len(grids), dtype=int)
+    sync_steps = np.zeros(len(grids), dtype=int)
+    active = np.arange(len(grids))
+    grids = grids.copy()
+    # Without a step limit, a grid that revisits a state is in a cycle that never synchronizes, so it is retired.
+    # Brent's cycle detection: compare against a saved copy that is refreshed at every power of two steps.
+    saved = grids.copy()
+
+    step = 0
+    while len(active) and (steps is None or step < steps):
+        step += 1
+        grids, flashes = next_iteration(grids)
+        flash_counts[active] += flashes
+
+        synchronized = flashes == grids[0].size
+        sync_steps[active[synchronized & (sync_steps[active] == 0)]] = step
+        if steps is None:
+            retired = synchronized | np.all(grids == saved, axis=(-2, -1))
+            if np.any(retired):
+                grids, saved, active = grids[~retired], saved[~retired], active[~retired]
+            if step & (step - 1) == 0:
+                saved = grids.copy()
+
+    return flash_counts, sync_steps
 
 
 if __name__ == "__main__":
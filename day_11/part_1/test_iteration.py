@@ -2,7 +2,7 @@ from io import StringIO
 
 import numpy as np
 
-from main import next_iteration
+from main import next_iteration, simulate
 
 
 def test_next_iteration():
@@ -53,3 +53,58 @@ def test_next_iteration():
     print(pred)
     print(data_2)
     np.testing.assert_equal(pred, data_2, verbose=True)
+
+
+def test_next_iteration_small_grid():
+    data = np.genfromtxt(StringIO("11111\n19991\n19191\n19991\n11111"), dtype=int, delimiter=1)
+
+    pred, flashes = next_iteration(data)
+    np.testing.assert_equal(pred, np.genfromtxt(StringIO("34543\n40004\n50005\n40004\n34543"), dtype=int, delimiter=1))
+    assert flashes == 9
+
+    pred, flashes = next_iteration(pred)
+    np.testing.assert_equal(pred, np.genfromtxt(StringIO("45654\n51115\n61116\n51115\n45654"), dtype=int, delimiter=1))
+    assert flashes == 0
+
+
+def test_simulate():
+    example = np.genfromtxt(
+        StringIO(
+            """5483143223
+2745854711
+5264556173
+6141336146
+6357385478
+4167524645
+2176841721
+6882881134
+4846848554
+5283751526"""
+        ),
+        dtype=int,
+        delimiter=1,
+    )
+    grids = np.stack([example, np.zeros_like(example), example])
+
+    pred, flashes = next_iteration(grids.copy())
+    for grid, grid_pred, grid_flashes in zip(grids, pred, flashes):
+        expected, expected_flashes = next_iteration(grid.copy())
+        np.testing.assert_equal(grid_pred, expected)
+        assert grid_flashes == expected_flashes
+
+    flash_counts, sync_steps = simulate(grids, steps=100)
+    np.testing.assert_equal(flash_counts, [1656, 1000, 1656])
+    np.testing.assert_equal(sync_steps, [0, 10, 0])
+
+    _, sync_steps = simulate(grids)
+    np.testing.assert_equal(sync_steps, [195, 10, 195])
+
+
+def test_simulate_retires_cycling_grids():
+    cycling = np.random.default_rng(0).integers(0, 10, (20, 10, 10))[0]
+    grids = np.stack([cycling, np.zeros_like(cycling)])
+
+    flash_counts, sync_steps = simulate(grids)
+
+    np.testing.assert_equal(sync_steps, [0, 10])
+    assert flash_counts[0] > 0
@@ -1,9 +1,8 @@
 import pytest
 
-from main import search, parse_graph
+from main import search, parse_graph, count_paths, CaveGraph
 
-
-@pytest.mark.parametrize(
+EXAMPLES = pytest.mark.parametrize(
     "graph, expected_path_count",
     [
         (
@@ -58,5 +57,49 @@ start-RW""".splitlines()
         ),
     ],
 )
+
+
+@EXAMPLES
 def test_search(graph, expected_path_count):
-    assert len(search(graph, "start", [])) == expected_path_count
+    assert len(list(search(graph, "start", []))) == expected_path_count
+
+
+@EXAMPLES
+def test_count_paths(graph, expected_path_count):
+    assert count_paths(graph) == expected_path_count
+
+
+def test_parse_graph():
+    graph = parse_graph(["start-A", "A-b", "A-end", "b-end"])
+
+    assert isinstance(graph, CaveGraph)
+    assert graph.names == ["b", "end", "start", "A"]
+    tunnels = {
+        (
+            graph.names[source],
+            graph.names[graph.targets[i]],
+            graph.names[graph.vias[i]] if graph.vias[i] != -1 else None,
+        )
+        for source in range(len(graph.names))
+        for i in range(graph.offsets[source], graph.offsets[source + 1])
+    }
+    assert tunnels == {
+        ("start", "b", "A"),
+        ("start", "end", "A"),
+        ("b", "b", "A"),
+        ("b", "end", "A"),
+        ("b", "end", None),
+    }
+
+
+def test_parse_graph_connected_big_caves():
+    with pytest.raises(ValueError):
+        parse_graph(["start-A", "A-B", "B-end"])
+
+
+@pytest.mark.parametrize("data", [["start-A", "A-b"], ["start-A", "b-end"], ["A-b", "b-end"]])
+def test_count_paths_without_route(data):
+    graph = parse_graph(data)
+
+    assert count_paths(graph) == 0
+    assert list(search(graph, "start", [])) == []
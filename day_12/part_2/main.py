@@ -1,36 +1,119 @@
+import dataclasses
+import functools
 import timeit
+from array import array
 from collections import defaultdict
+from typing import Generator, Optional
 
 import fire
 
 
+@dataclasses.dataclass
+class CaveGraph:
+    names: list[str]
+    ids: dict[str, int]
+    # Tunnels in compressed sparse row form: tunnel i leaves its cave between offsets[cave] and offsets[cave + 1] and
+    # leads to targets[i]. Big caves are collapsed into the tunnels of their neighbours, vias[i] is the big cave passed
+    # on the way or -1.
+    offsets: array
+    targets: array
+    vias: array
+
+    @property
+    def start(self) -> Optional[int]:
+        return self.ids.get("start")
+
+    @property
+    def end(self) -> Optional[int]:
+        return self.ids.get("end")
+
+
 def search(
-    graph: dict[str, list[str]], current: str, current_path: list[str], has_visited_twice: bool
-) -> list[list[str]]:
-    current_path.append(current)
-    if current == "end":
-        return [current_path]
+    graph: CaveGraph, current: str, current_path: list[str], has_visited_twice: bool, visited: int = 0
+) -> Generator[list[str], None, None]:
+    end = graph.end
+
+    def walk(node: int, visited: int, has_visited_twice: bool) -> Generator[list[str], None, None]:
+        depth = len(current_path)
+        current_path.append(graph.names[node])
+        try:
+            if node == end:
+                yield current_path.copy()
+                return
+
+            visited |= 1 << node
+            for tunnel in range(graph.offsets[node], graph.offsets[node + 1]):
+                target = graph.targets[tunnel]
+                is_second_visit = bool(visited >> target & 1)
+                if is_second_visit and has_visited_twice:
+                    continue
+                if graph.vias[tunnel] != -1:
+                    current_path.append(graph.names[graph.vias[tunnel]])
+                yield from walk(target, visited, has_visited_twice or is_second_visit)
+                del current_path[depth + 1 :]
+        finally:
+            del current_path[depth:]
 
-    paths = []
-    for node in graph[current]:
-        if node not in current_path or node.isupper():
-            paths.extend(search(graph, node, current_path.copy(), has_visited_twice))
-        if node in current_path and node.islower() and not has_visited_twice:
-            paths.extend(search(graph, node, current_path.copy(), True))
+    if current in graph.ids:
+        yield from walk(graph.ids[current], visited, has_visited_twice)
 
-    return paths
 
+def count_paths(graph: CaveGraph, has_visited_twice: bool = False) -> int:
+    @functools.lru_cache(maxsize=None)
+    def count(current: int, visited: int, has_visited_twice: bool) -> int:
+        if current == graph.end:
+            return 1
 
-def parse_graph(data: list[str]) -> dict[str, list[str]]:
-    graph = defaultdict(list)
+        total = 0
+        for target in graph.targets[graph.offsets[current] : graph.offsets[current + 1]]:
+            if not visited >> target & 1:
+                total += count(target, visited | 1 << target, has_visited_twice)
+            elif not has_visited_twice:
+                total += count(target, visited, True)
+        return total
+
+    if graph.start is None or graph.end is None:
+        return 0
+    return count(graph.start, 1 << graph.start, has_visited_twice)
+
+
+def parse_graph(data: list[str]) -> CaveGraph:
+    adjacency = defaultdict(list)
     for line in data:
         node_a, node_b = line.split("-")
 
         if node_a != "end" and node_b != "start":
-            graph[node_a].append(node_b)
+            adjacency[node_a].append(node_b)
         if node_b != "end" and node_a != "start":
-            graph[node_b].append(node_a)
-    return graph
+            adjacency[node_b].append(node_a)
+
+    # Small caves get the lowest ids, so they fit into a compact visited mask.
+    nodes = set(adjacency).union(*adjacency.values())
+    names = sorted(node for node in nodes if node.islower()) + sorted(node for node in nodes if node.isupper())
+    ids = {name: i for i, name in enumerate(names)}
+
+    offsets, targets, vias = array("l", [0]), array("l"), array("l")
+    for name in names:
+        if name.islower():
+            for neighbour in adjacency[name]:
+                if neighbour.islower():
+                    targets.append(ids[neighbour])
+                    vias.append(-1)
+                    continue
+                for target in adjacency[neighbour]:
+                    if target.isupper():
+                        raise ValueError(f"Big caves {neighbour} and {target} are connected")
+                    targets.append(ids[target])
+                    vias.append(ids[neighbour])
+        offsets.append(len(targets))
+
+    return CaveGraph(
+        names=names,
+        ids=ids,
+        offsets=offsets,
+        targets=targets,
+        vias=vias,
+    )
 
 
 def main(input_file: str = "input.txt") -> None:
@@ -40,8 +123,7 @@ def main(input_file: str = "input.txt") -> None:
 
     graph = parse_graph(data)
 
-    paths = search(graph, "start", [], False)
-    print(len(paths))
+    print(count_paths(graph))
 
 
 if __name__ == "__main__":
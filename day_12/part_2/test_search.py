@@ -1,9 +1,8 @@
 import pytest
 
-from main import search, parse_graph
+from main import search, parse_graph, count_paths
 
-
-@pytest.mark.parametrize(
+EXAMPLES = pytest.mark.parametrize(
     "graph, expected_path_count",
     [
         (
@@ -58,5 +57,35 @@ start-RW""".splitlines()
         ),
     ],
 )
+
+
+@EXAMPLES
 def test_search(graph, expected_path_count):
-    assert len(search(graph, "start", [], False)) == expected_path_count
+    assert len(list(search(graph, "start", [], False))) == expected_path_count
+
+
+@EXAMPLES
+def test_count_paths(graph, expected_path_count):
+    assert count_paths(graph) == expected_path_count
+
+
+def test_search_prefix():
+    graph = parse_graph(["start-A", "start-b", "A-c", "A-b", "b-d", "A-end", "b-end"])
+    current_path = []
+    paths = search(graph, "start", current_path, False)
+
+    first, second = next(paths), next(paths)
+    assert first[0] == second[0] == "start"
+    assert first[-1] == second[-1] == "end"
+    assert first != second
+
+    paths.close()
+    assert current_path == []
+
+
+@pytest.mark.parametrize("data", [["start-A", "A-b"], ["start-A", "b-end"], ["A-b", "b-end"]])
+def test_count_paths_without_route(data):
+    graph = parse_graph(data)
+
+    assert count_paths(graph) == 0
+    assert list(search(graph, "start", [], False)) == []
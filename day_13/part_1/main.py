@@ -1,59 +1,57 @@
 import timeit
-from operator import itemgetter
 
 import fire
 import numpy as np
-from matplotlib import pyplot as plt
 
+AXES = {"x": 0, "y": 1}
 
-def main(input_file: str = "input.txt") -> None:
+
+def parse_input(input_file: str) -> tuple[np.ndarray, list[tuple[int, int]]]:
     with open(input_file) as f:
-        lines = f.read().splitlines()
+        dot_lines, fold_lines = f.read().strip().split("\n\n")
+
+    dots = np.array(dot_lines.replace(",", " ").split(), dtype=np.int64).reshape(-1, 2)
 
-    points = []
     folds = []
-    for line in lines:
-        if not line:
-            continue
-
-        if line[0].isdigit():
-            points.append(tuple(map(int, line.split(","))))
-        if line.startswith("fold along "):
-            axis, place = line.replace("fold along ", "").split("=")
-            folds.append((axis, int(place)))
-
-    x_max, y_max = max(map(itemgetter(0), points)), max(map(itemgetter(1), points))
-
-    grid = np.zeros((x_max + 1, y_max + 1), dtype=bool)
-    for point in points:
-        grid[point] = 1
-
-    for axis, place in folds:
-        if axis == "x":
-            left, right = grid[:place, :], grid[place + 1 :, :]
-            if left.shape[0] > right.shape[0]:
-                right = np.concatenate(
-                    [right, np.zeros((left.shape[0] - right.shape[0], right.shape[1]), dtype=bool)], axis=0
-                )
-            if left.shape[0] < right.shape[0]:
-                left = np.concatenate(
-                    [np.zeros((right.shape[0] - left.shape[0], right.shape[1]), dtype=bool), left], axis=0
-                )
-
-            grid = left + np.flip(right, axis=0)
-
-        else:
-            top, bot = grid[:, :place], grid[:, place + 1 :]
-            if top.shape[1] > bot.shape[1]:
-                bot = np.concatenate([bot, np.zeros((bot.shape[0], top.shape[1] - bot.shape[1]), dtype=bool)], axis=1)
-            if top.shape[1] < bot.shape[1]:
-                top = np.concatenate([np.zeros((bot.shape[0], bot.shape[1] - top.shape[1]), dtype=bool), top], axis=1)
-            grid = top + np.flip(bot, axis=1)
-
-    plt.imshow(np.transpose(grid))
-    plt.show()
-
-    print(np.sum(grid))
+    for line in fold_lines.splitlines():
+        axis, place = line.removeprefix("fold along ").split("=")
+        if axis not in AXES:
+            raise ValueError(f"Unexpected fold axis {axis}")
+        folds.append((AXES[axis], int(place)))
+    return dots, folds
+
+
+def fold(dots: np.ndarray, folds: list[tuple[int, int]], unique: bool = False) -> np.ndarray:
+    # Folds along different axes commute, so each column goes through all of its folds in one in-place pass.
+    folded = np.empty_like(dots)
+    for axis in AXES.values():
+        column = dots[:, axis].copy()
+        for place in [fold_place for fold_axis, fold_place in folds if fold_axis == axis]:
+            # The same as where(column > place, 2 * place - column, column) without the temporaries.
+            column -= place
+            np.abs(column, out=column)
+            np.subtract(place, column, out=column)
+        folded[:, axis] = column
+    return np.unique(folded, axis=0) if unique else folded
+
+
+def main(input_file: str = "input.txt", plot: bool = False) -> None:
+    dots, folds = parse_input(input_file)
+
+    dots = fold(dots, folds, unique=True)
+
+    if plot:
+        from matplotlib import pyplot as plt
+
+        # Folds left of the middle mirror dots to negative coordinates.
+        dots -= dots.min(axis=0)
+        grid = np.zeros(dots.max(axis=0) + 1, dtype=bool)
+        grid[tuple(dots.T)] = True
+
+        plt.imshow(np.transpose(grid))
+        plt.show()
+
+    print(len(dots))
 
 
 if __name__ == "__main__":
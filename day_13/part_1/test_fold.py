@@ -0,0 +1,33 @@
+import numpy as np
+
+from main import fold, parse_input
+
+
+def test_parse_input():
+    dots, folds = parse_input("input_small.txt")
+
+    assert dots.shape == (18, 2)
+    assert dots[0].tolist() == [6, 10]
+    assert folds == [(1, 7), (0, 5)]
+
+
+def test_fold():
+    dots, folds = parse_input("input_small.txt")
+
+    assert len(fold(dots, folds[:1], unique=True)) == 17
+    assert len(fold(dots, folds, unique=True)) == 16
+    assert len(fold(dots, folds)) == len(dots)
+
+
+def test_fold_huge_sparse_sheet():
+    dots = np.array([[0, 0], [2 * 10**12, 10**12], [10**12 - 1, 0]], dtype=np.int64)
+
+    folded = fold(dots, [(0, 10**12), (1, 10**12 // 2)], unique=True)
+
+    assert folded.tolist() == [[0, 0], [10**12 - 1, 0]]
+
+
+def test_fold_left_of_the_middle():
+    dots = np.array([[0, 0], [5, 0]], dtype=np.int64)
+
+    assert fold(dots, [(0, 1)]).tolist() == [[0, 0], [-3, 0]]
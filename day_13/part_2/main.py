@@ -1,45 +1,46 @@
 import timeit
-from operator import itemgetter
 
 import fire
 import numpy as np
 
+AXES = {"x": 0, "y": 1}
 
-def main(input_file: str = "input.txt") -> None:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
-
-    points = []
-    folds = []
-    for line in lines:
-        if not line:
-            continue
 
-        if line[0].isdigit():
-            points.append(tuple(map(int, line.split(","))))
-        if line.startswith("fold along "):
-            axis, place = line.replace("fold along ", "").split("=")
-            folds.append((axis, int(place)))
-
-    x_max, y_max = max(map(itemgetter(0), points)), max(map(itemgetter(1), points))
+def parse_input(input_file: str) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    with open(input_file) as f:
+        dot_lines, fold_lines = f.read().strip().split("\n\n")
 
-    grid = np.zeros((x_max + 1, y_max + 1), dtype=bool)
-    for point in points:
-        grid[point] = 1
+    dots = np.array(dot_lines.replace(",", " ").split(), dtype=np.int64).reshape(-1, 2)
 
-    for axis, place in folds:
-        if axis == "x":
-            left, right = grid[:place, :], grid[place + 1 :, :]
+    folds = []
+    for line in fold_lines.splitlines():
+        axis, place = line.removeprefix("fold along ").split("=")
+        if axis not in AXES:
+            raise ValueError(f"Unexpected fold axis {axis}")
+        folds.append((AXES[axis], int(place)))
+    return dots, folds
+
+
+def fold(dots: np.ndarray, folds: list[tuple[int, int]], unique: bool = False) -> np.ndarray:
+    # Folds along different axes commute, so each column goes through all of its folds in one in-place pass.
+    folded = np.empty_like(dots)
+    for axis in AXES.values():
+        column = dots[:, axis].copy()
+        for place in [fold_place for fold_axis, fold_place in folds if fold_axis == axis]:
+            # The same as where(column > place, 2 * place - column, column) without the temporaries.
+            column -= place
+            np.abs(column, out=column)
+            np.subtract(place, column, out=column)
+        folded[:, axis] = column
+    return np.unique(folded, axis=0) if unique else folded
 
-            grid = left + np.flip(right, axis=0)
 
-        else:
-            top, bot = grid[:, :place], grid[:, place + 1 :]
-            grid = top + np.flip(bot, axis=1)
+def main(input_file: str = "input.txt") -> None:
+    dots, folds = parse_input(input_file)
 
-        break
+    dots = fold(dots, folds[:1], unique=True)
 
-    print(np.sum(grid))
+    print(len(dots))
 
 
 if __name__ == "__main__":
@@ -1,36 +1,99 @@
+from __future__ import annotations
+
+import dataclasses
+import itertools
 import timeit
-from collections import Counter
+from typing import Generator, Optional
 
 import fire
+import numpy as np
 
 
-def main(input_file: str = "input.txt") -> None:
+def main(input_file: str = "input.txt", steps: int = 10) -> None:
     template, substitutions = parse_input(input_file)
 
-    counter = Counter()
-    for combination in zip(template, template[1:]):
-        counter["".join(combination)] += 1
-
-    for _ in range(10):
-        next_counter = counter.copy()
-        for combination, count in counter.items():
-            if count > 0 and combination in substitutions:
-                to_str = substitutions[combination]
-                next_counter[combination] -= count
-                next_counter[combination[0] + to_str] += count
-                next_counter[to_str + combination[1]] += count
-        counter = next_counter
-
-    char_counter = Counter()
-    for combination, count in counter.items():
-        for char in combination:
-            char_counter[char] += count
-
-    char_counter[template[0]] += 1
-    char_counter[template[-1]] += 1
-    char_counter = {char: count // 2 for char, count in char_counter.items()}
-
-    print(max(char_counter.values()) - min(char_counter.values()))
+    counts = Polymer.compile(template, substitutions).histogram(steps)
+    counts = counts[counts > 0]
+
+    print(max(counts) - min(counts))
+
+
+@dataclasses.dataclass
+class Polymer:
+    elements: list[str]
+    pairs: np.ndarray
+    last: int
+    # One insertion step as a sparse matrix in coordinate form: pair sources[i] adds its count to pair targets[i].
+    sources: np.ndarray
+    targets: np.ndarray
+
+    @classmethod
+    def compile(cls, template: str, substitutions: dict[str, str]) -> Polymer:
+        elements = sorted(set(template).union(*substitutions, *substitutions.values()))
+        index = {element: i for i, element in enumerate(elements)}
+        size = len(elements)
+
+        pairs = np.zeros(size * size, dtype=object)
+        for left, right in zip(template, template[1:]):
+            pairs[index[left] * size + index[right]] += 1
+
+        sources, targets = [], []
+        for left, right in itertools.product(elements, repeat=2):
+            source = index[left] * size + index[right]
+            if left + right in substitutions:
+                inserted = index[substitutions[left + right]]
+                sources += [source, source]
+                targets += [index[left] * size + inserted, inserted * size + index[right]]
+            else:
+                sources.append(source)
+                targets.append(source)
+
+        return cls(
+            elements=elements,
+            pairs=pairs,
+            last=index[template[-1]],
+            sources=np.array(sources),
+            targets=np.array(targets),
+        )
+
+    def step(self, pairs: np.ndarray) -> np.ndarray:
+        next_pairs = np.zeros_like(pairs)
+        np.add.at(next_pairs, self.targets, pairs[self.sources])
+        return next_pairs
+
+    def count_elements(self, pairs: np.ndarray) -> np.ndarray:
+        size = len(self.elements)
+        counts = pairs.reshape(size, size).sum(axis=1)
+        counts[self.last] += 1
+        return counts
+
+    def histograms(self) -> Generator[np.ndarray, None, None]:
+        pairs = self.pairs
+        while True:
+            yield self.count_elements(pairs)
+            pairs = self.step(pairs)
+
+    def histogram(self, steps: int, modulus: Optional[int] = None) -> np.ndarray:
+        if modulus is None:
+            return next(itertools.islice(self.histograms(), steps, None))
+
+        from scipy.sparse import csr_matrix
+
+        size = len(self.pairs)
+        if modulus**2 * size >= 2**63:
+            raise ValueError(f"Modulus {modulus} is too large for {size} pairs")
+
+        matrix = csr_matrix(
+            (np.ones(len(self.sources), dtype=np.int64), (self.targets, self.sources)), shape=(size, size)
+        )
+        pairs = (self.pairs % modulus).astype(np.int64)
+        while steps:
+            if steps & 1:
+                pairs = matrix @ pairs % modulus
+            matrix = matrix @ matrix
+            matrix.data %= modulus
+            steps >>= 1
+        return self.count_elements(pairs) % modulus
 
 
 def parse_input(input_file: str) -> tuple[str, dict[str, str]]:
@@ -0,0 +1,49 @@
+import itertools
+
+import pytest
+
+from main import Polymer
+
+TEMPLATE = "NNCB"
+SUBSTITUTIONS = dict(
+    line.split(" -> ")
+    for line in """CH -> B
+HH -> N
+CB -> H
+NH -> C
+HB -> C
+HC -> B
+HN -> C
+NN -> C
+BH -> H
+NC -> B
+NB -> B
+BN -> B
+BB -> N
+BC -> B
+CC -> N
+CN -> C""".splitlines()
+)
+
+
+@pytest.mark.parametrize("steps, expected", [(10, 1588), (40, 2188189693529)])
+def test_histogram(steps, expected):
+    counts = Polymer.compile(TEMPLATE, SUBSTITUTIONS).histogram(steps)
+
+    assert max(counts) - min(counts) == expected
+
+
+def test_histograms():
+    polymer = Polymer.compile(TEMPLATE, SUBSTITUTIONS)
+    histograms = list(itertools.islice(polymer.histograms(), 6))
+
+    for steps, counts in enumerate(histograms):
+        assert sum(counts) == 3 * 2**steps + 1
+    assert dict(zip(polymer.elements, histograms[1])) == {"B": 2, "C": 2, "H": 1, "N": 2}
+
+
+@pytest.mark.parametrize("steps", [0, 1, 10, 123])
+def test_histogram_modulus(steps):
+    polymer = Polymer.compile(TEMPLATE, SUBSTITUTIONS)
+
+    assert list(polymer.histogram(steps, modulus=1009)) == [count % 1009 for count in polymer.histogram(steps)]
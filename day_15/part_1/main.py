@@ -1,26 +1,86 @@
+import dataclasses
+import math
 import timeit
+from typing import Optional
 
 import fire
-import networkx as nx
 import numpy as np
 
 
 def main(input_file: str = "input.txt") -> None:
     data = np.genfromtxt(input_file, dtype=int, delimiter=1)
-    data = np.pad(data, ((1, 1), (1, 1)), mode="constant", constant_values=0)
 
-    G = nx.DiGraph()
+    print(shortest_path(data).risk)
 
-    for i in range(len(data)):
-        for j in range(len(data[1])):
-            G.add_node(f"{i},{j}")
 
-    for i in range(1, len(data) - 1):
-        for j in range(1, len(data[1]) - 1):
-            for k, l in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                G.add_edge(f"{i},{j}", f"{i + k},{j + l}", weight=data[i + k][j + l])
+@dataclasses.dataclass
+class SearchResult:
+    risk: int
+    path: list[tuple[int, int]]
+    expanded: int
 
-    print(nx.shortest_path_length(G, source="1,1", target=f"{len(data) - 2},{len(data) - 2}", weight="weight"))
+
+def shortest_path(
+    risk_map: np.ndarray, source: tuple[int, int] = (0, 0), target: Optional[tuple[int, int]] = None
+) -> SearchResult:
+    height, width = risk_map.shape
+    if target is None:
+        target = (height - 1, width - 1)
+
+    weights = risk_map.ravel().tolist()
+    start = source[0] * width + source[1]
+    goal = target[0] * width + target[1]
+
+    distances = [math.inf] * (height * width)
+    previous = [-1] * (height * width)
+    distances[start] = 0
+
+    # Dial's algorithm: open distances never exceed the current one by more than the highest risk.
+    bucket_count = int(risk_map.max()) + 1
+    buckets = [[] for _ in range(bucket_count)]
+    buckets[0].append(start)
+    pending = 1
+    expanded = 0
+
+    current = 0
+    while pending:
+        bucket = buckets[current % bucket_count]
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+            if distances[node] != current:
+                continue
+            if node == goal:
+                return SearchResult(risk=current, path=trace_path(previous, goal, width), expanded=expanded)
+            expanded += 1
+
+            row, col = divmod(node, width)
+            for neighbour, valid in (
+                (node - width, row > 0),
+                (node + width, row < height - 1),
+                (node - 1, col > 0),
+                (node + 1, col < width - 1),
+            ):
+                if not valid:
+                    continue
+                distance = current + weights[neighbour]
+                if distance < distances[neighbour]:
+                    distances[neighbour] = distance
+                    previous[neighbour] = node
+                    buckets[distance % bucket_count].append(neighbour)
+                    pending += 1
+        current += 1
+
+    raise ValueError(f"Target {target} is not reachable from {source}")
+
+
+def trace_path(previous: list[int], goal: int, width: int) -> list[tuple[int, int]]:
+    path = []
+    node = goal
+    while node != -1:
+        path.append(divmod(node, width))
+        node = previous[node]
+    return path[::-1]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+from io import StringIO
+
+import numpy as np
+import pytest
+
+from main import shortest_path
+
+EXAMPLE = np.genfromtxt(
+    StringIO(
+        """1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+    ),
+    dtype=int,
+    delimiter=1,
+)
+
+
+@pytest.mark.parametrize(
+    "risk_map, source, target, expected_risk",
+    [
+        (EXAMPLE, (0, 0), None, 40),
+        (EXAMPLE, (0, 0), (0, 0), 0),
+        (EXAMPLE, (0, 0), (0, 2), 7),
+        (EXAMPLE, (9, 9), (0, 0), 40),
+        (np.array([[1, 9, 9], [1, 9, 1], [1, 1, 1]]), (0, 0), None, 4),
+    ],
+)
+def test_shortest_path(risk_map, source, target, expected_risk):
+    result = shortest_path(risk_map, source, target)
+
+    assert result.risk == expected_risk
+    assert result.path[0] == source
+    assert result.path[-1] == (target or (len(risk_map) - 1, len(risk_map[0]) - 1))
+    assert sum(risk_map[point] for point in result.path[1:]) == expected_risk
+    for (row_a, col_a), (row_b, col_b) in zip(result.path, result.path[1:]):
+        assert abs(row_a - row_b) + abs(col_a - col_b) == 1
@@ -1,38 +1,206 @@
+import dataclasses
 import timeit
+from array import array
+from typing import Callable, Generator, Optional, Sequence
 
 import fire
-import networkx as nx
 import numpy as np
 
+UNREACHED = 2**32 - 1
 
-def main(input_file: str = "input.txt") -> None:
+
+def main(input_file: str = "input.txt", tile_factor: int = 5, strategy: str = "dijkstra") -> None:
     data = np.genfromtxt(input_file, dtype=int, delimiter=1)
-    out = data.copy()
-    for offset in range(1, 5):
-        tile = data + offset
-        tile[tile > 9] -= 9
-        out = np.concatenate((out, tile), axis=0)
-    data = out
-    out = data.copy()
-    for offset in range(1, 5):
-        tile = data + offset
-        tile[tile > 9] -= 9
-        out = np.concatenate((out, tile), axis=1)
-    data = out
-
-    data = np.pad(data, ((1, 1), (1, 1)), mode="constant", constant_values=0)
-
-    G = nx.DiGraph()
-    for i in range(len(data)):
-        for j in range(len(data[1])):
-            G.add_node(f"{i},{j}")
-
-    for i in range(1, len(data) - 1):
-        for j in range(1, len(data[1]) - 1):
-            for k, l in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                G.add_edge(f"{i},{j}", f"{i + k},{j + l}", weight=data[i + k][j + l])
-
-    print(nx.shortest_path_length(G, source="1,1", target=f"{len(data) - 2},{len(data) - 2}", weight="weight"))
+
+    result = shortest_path(TiledRiskMap(data, tile_factor), strategy=strategy)
+    print(f"Nodes expanded: {result.expanded}")
+    print(result.risk)
+
+
+@dataclasses.dataclass
+class TiledRiskMap:
+    base: np.ndarray
+    factor: int = 5
+    rows: list[list[int]] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.rows = self.base.tolist()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.base.shape[0] * self.factor, self.base.shape[1] * self.factor
+
+    def risk(self, row: int, col: int) -> int:
+        height, width = self.base.shape
+        return (self.rows[row % height][col % width] + row // height + col // width - 1) % 9 + 1
+
+    def max(self) -> int:
+        return max(int(np.max((self.base + offset - 1) % 9 + 1)) for offset in range(min(9, 2 * self.factor - 1)))
+
+    def to_array(self) -> np.ndarray:
+        height, width = self.base.shape
+        rows, cols = np.indices(self.shape)
+        return (np.tile(self.base, (self.factor, self.factor)) + rows // height + cols // width - 1) % 9 + 1
+
+
+@dataclasses.dataclass
+class SearchResult:
+    risk: int
+    path: list[tuple[int, int]]
+    expanded: int
+
+
+@dataclasses.dataclass
+class Frontier:
+    size: int
+    bucket_count: int
+    key: int = 0
+    pending: int = 0
+    distances: array = dataclasses.field(init=False, repr=False)
+    buckets: list[list[int]] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Four bytes per cell and no predecessors, paths are traced back from the distances instead.
+        self.distances = array("I", [UNREACHED]) * self.size
+        self.buckets = [[] for _ in range(self.bucket_count)]
+
+    def push(self, node: int, distance: int, key: int) -> None:
+        self.distances[node] = distance
+        self.buckets[key % self.bucket_count].append(node)
+        self.pending += 1
+
+    def peek(self) -> int:
+        while not self.buckets[self.key % self.bucket_count]:
+            self.key += 1
+        return self.key
+
+    def pop(self) -> int:
+        self.peek()
+        self.pending -= 1
+        return self.buckets[self.key % self.bucket_count].pop()
+
+
+def shortest_path(
+    risk_map: TiledRiskMap,
+    source: tuple[int, int] = (0, 0),
+    target: Optional[tuple[int, int]] = None,
+    strategy: str = "dijkstra",
+) -> SearchResult:
+    height, width = risk_map.shape
+    if target is None:
+        target = (height - 1, width - 1)
+
+    start = source[0] * width + source[1]
+    goal = target[0] * width + target[1]
+
+    if strategy == "dijkstra":
+        return directed_search(risk_map, start, goal, heuristic=lambda row, col: 0)
+    if strategy == "astar":
+        return directed_search(
+            risk_map, start, goal, heuristic=lambda row, col: abs(target[0] - row) + abs(target[1] - col)
+        )
+    if strategy == "bidirectional":
+        return bidirectional_search(risk_map, start, goal)
+    raise ValueError(f"Unexpected strategy {strategy}")
+
+
+def neighbours(node: int, height: int, width: int) -> Generator[tuple[int, int, int], None, None]:
+    row, col = divmod(node, width)
+    if row > 0:
+        yield node - width, row - 1, col
+    if row < height - 1:
+        yield node + width, row + 1, col
+    if col > 0:
+        yield node - 1, row, col - 1
+    if col < width - 1:
+        yield node + 1, row, col + 1
+
+
+def directed_search(
+    risk_map: TiledRiskMap, start: int, goal: int, heuristic: Callable[[int, int], int]
+) -> SearchResult:
+    height, width = risk_map.shape
+    risk = risk_map.risk
+
+    # Dial's algorithm: risks are at most max, and a consistent heuristic moves the key by at most one more than the
+    # risk, so every open key lies in max + 2 rotating buckets.
+    start_key = heuristic(*divmod(start, width))
+    frontier = Frontier(height * width, risk_map.max() + 2, key=start_key)
+    frontier.push(start, 0, start_key)
+    expanded = 0
+
+    while frontier.pending:
+        node = frontier.pop()
+        distance = frontier.distances[node]
+        if distance + heuristic(*divmod(node, width)) != frontier.key:
+            continue
+        if node == goal:
+            path = trace_path(frontier.distances, risk_map, goal, start)[::-1]
+            return SearchResult(risk=distance, path=path, expanded=expanded)
+        expanded += 1
+
+        for neighbour, row, col in neighbours(node, height, width):
+            candidate = distance + risk(row, col)
+            if candidate < frontier.distances[neighbour]:
+                frontier.push(neighbour, candidate, candidate + heuristic(row, col))
+
+    raise ValueError(f"Node {goal} is not reachable from {start}")
+
+
+def bidirectional_search(risk_map: TiledRiskMap, start: int, goal: int) -> SearchResult:
+    height, width = risk_map.shape
+    risk = risk_map.risk
+
+    forward = Frontier(height * width, risk_map.max() + 1)
+    backward = Frontier(height * width, risk_map.max() + 1)
+    forward.push(start, 0, 0)
+    backward.push(goal, 0, 0)
+    best, meeting = (0, start) if start == goal else (UNREACHED, -1)
+    expanded = 0
+
+    # Backward distances exclude the risk of the node itself, so a path through a node costs the sum of both labels.
+    while forward.pending and backward.pending and forward.peek() + backward.peek() < best:
+        is_forward = forward.key <= backward.key
+        frontier, other = (forward, backward) if is_forward else (backward, forward)
+
+        node = frontier.pop()
+        distance = frontier.distances[node]
+        if distance != frontier.key:
+            continue
+        expanded += 1
+
+        node_risk = risk(*divmod(node, width))
+        for neighbour, row, col in neighbours(node, height, width):
+            candidate = distance + (risk(row, col) if is_forward else node_risk)
+            if candidate < frontier.distances[neighbour]:
+                frontier.push(neighbour, candidate, candidate)
+                if candidate + other.distances[neighbour] < best:
+                    best, meeting = candidate + other.distances[neighbour], neighbour
+
+    if meeting == -1:
+        raise ValueError(f"Node {goal} is not reachable from {start}")
+
+    path = trace_path(forward.distances, risk_map, meeting, start)[::-1]
+    path += trace_path(backward.distances, risk_map, meeting, goal, forward=False)[1:]
+    return SearchResult(risk=best, path=path, expanded=expanded)
+
+
+def trace_path(
+    distances: Sequence[int], risk_map: TiledRiskMap, node: int, origin: int, forward: bool = True
+) -> list[tuple[int, int]]:
+    # Every node on a shortest path has a neighbour whose distance plus the risk of the step gives its own distance.
+    # Forward distances include the risk of the node entered, backward distances the risk of the node left.
+    height, width = risk_map.shape
+    path = [divmod(node, width)]
+    while node != origin:
+        node_risk = risk_map.risk(*path[-1])
+        node = next(
+            neighbour
+            for neighbour, row, col in neighbours(node, height, width)
+            if distances[neighbour] + (node_risk if forward else risk_map.risk(row, col)) == distances[node]
+        )
+        path.append(divmod(node, width))
+    return path
 
 
 if __name__ == "__main__":
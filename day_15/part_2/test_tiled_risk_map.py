@@ -0,0 +1,71 @@
+from io import StringIO
+
+import numpy as np
+import pytest
+
+from main import TiledRiskMap, shortest_path
+
+EXAMPLE = np.genfromtxt(
+    StringIO(
+        """1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+    ),
+    dtype=int,
+    delimiter=1,
+)
+
+
+def concatenate_tiles(data: np.ndarray, factor: int) -> np.ndarray:
+    out = data.copy()
+    for offset in range(1, factor):
+        tile = data + offset
+        tile[tile > 9] -= 9
+        out = np.concatenate((out, tile), axis=0)
+    data = out
+    out = data.copy()
+    for offset in range(1, factor):
+        tile = data + offset
+        tile[tile > 9] -= 9
+        out = np.concatenate((out, tile), axis=1)
+    return out
+
+
+@pytest.mark.parametrize("factor", [1, 2, 5])
+def test_tiled_risk_map(factor):
+    risk_map = TiledRiskMap(EXAMPLE, factor)
+    expected = concatenate_tiles(EXAMPLE, factor)
+
+    np.testing.assert_equal(risk_map.to_array(), expected)
+    assert risk_map.shape == expected.shape
+    assert risk_map.max() == np.max(expected)
+    assert all(risk_map.risk(row, col) == expected[row, col] for row, col in np.ndindex(expected.shape))
+
+
+@pytest.mark.parametrize("strategy", ["dijkstra", "astar", "bidirectional"])
+@pytest.mark.parametrize(
+    "factor, source, target, expected_risk",
+    [(1, (0, 0), None, 40), (5, (0, 0), None, 315), (1, (3, 3), (3, 3), 0), (1, (9, 9), (0, 0), 40)],
+)
+def test_shortest_path(strategy, factor, source, target, expected_risk):
+    risk_map = TiledRiskMap(EXAMPLE, factor)
+    result = shortest_path(risk_map, source, target, strategy=strategy)
+
+    assert result.risk == expected_risk
+    assert result.path[0] == source
+    assert result.path[-1] == (target or (risk_map.shape[0] - 1, risk_map.shape[1] - 1))
+    assert sum(risk_map.risk(row, col) for row, col in result.path[1:]) == expected_risk
+    for (row_a, col_a), (row_b, col_b) in zip(result.path, result.path[1:]):
+        assert abs(row_a - row_b) + abs(col_a - col_b) == 1
+
+
+def test_shortest_path_unknown_strategy():
+    with pytest.raises(ValueError):
+        shortest_path(TiledRiskMap(EXAMPLE, 1), strategy="bfs")
@@ -5,7 +5,6 @@ from contextlib import nullcontext
 from io import StringIO
 
 import fire
-import matplotlib.pyplot as plt
 import numpy as np
 from scipy.ndimage import convolve
 
@@ -15,6 +14,9 @@ KERNEL = np.array([[1, 2, 4], [8, 16, 32], [64, 128, 256]])
 def main(input_file: str = "input.txt", plot: bool = False, iterations: int = 2) -> None:
     image_enhancement_algorithm, image = parse_input(input_file)
 
+    if plot:
+        import matplotlib.pyplot as plt
+
     with plt.ion() if plot else nullcontext():
         if plot:
             plt.axis("off")
@@ -4,7 +4,6 @@ from io import StringIO
 
 import fire
 import numpy as np
-from matplotlib import pyplot as plt
 from scipy.ndimage import generic_filter
 
 
@@ -38,6 +37,9 @@ def main(input_file: str = "input.txt", plot: bool = False) -> None:
 
     current_step = np.genfromtxt(StringIO(input_data), dtype=int, delimiter=1)
 
+    if plot:
+        from matplotlib import pyplot as plt
+
     iterations = 0
     with plt.ion() if plot else nullcontext():
         if plot:
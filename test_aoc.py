@@ -0,0 +1,33 @@
+import pytest
+
+from aoc import discover, run_solver, format_table, import_profile
+
+IMPORT_BUDGET_S = 1.5
+
+
+def test_discover():
+    solvers = discover()
+
+    assert len(solvers) == 49
+    assert solvers[0].name == "day_01/part_1"
+    assert solvers[-1].name == "day_25/part_1"
+    assert [solver.name for solver in discover([6])] == ["day_06/part_1", "day_06/part_2"]
+
+
+def test_run_solver():
+    solver, *_ = discover([1])
+    timing = run_solver(solver, repeat=2)
+
+    assert timing.error is None
+    assert timing.result == "1548"
+    assert timing.cold_s >= timing.import_s
+    assert timing.warm_s is not None
+    assert timing.name in format_table([timing])
+
+
+@pytest.mark.parametrize("solver", discover(), ids=lambda solver: solver.name)
+def test_import_budget(solver):
+    profile = import_profile(solver)
+
+    assert "matplotlib" not in profile.heavy_modules
+    assert profile.import_s < IMPORT_BUDGET_S